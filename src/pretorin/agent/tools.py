@@ -403,8 +403,10 @@ def create_platform_tools(
             )
 
         payload_items = [_item_payload(item) for item in items]
-        for item in payload_items:
-            await client.get_control(resolved_framework_id, item.control_id)
+        await client.get_controls_bulk(
+            resolved_framework_id,
+            list(dict.fromkeys(item.control_id for item in payload_items)),
+        )
         result = await client.create_evidence_batch(
             resolved_system_id,
             resolved_framework_id,
@@ -0,0 +1,21 @@
+"""Response cache CLI commands for Pretorin."""
+
+import typer
+from rich import print as rprint
+
+from pretorin.client import api
+
+app = typer.Typer()
+
+
+@app.command("clear")
+def cache_clear() -> None:
+    """Delete all cached framework reference responses."""
+    removed = api.clear_response_cache()
+    rprint(f"[#95D7E0]✓[/#95D7E0] Removed {removed} cached response(s) from {api.RESPONSE_CACHE_DIR}")
+
+
+@app.command("path")
+def cache_path() -> None:
+    """Show the response cache directory."""
+    rprint(str(api.RESPONSE_CACHE_DIR))
@@ -15,7 +15,7 @@ from pretorin.cli.animations import AnimationTheme, animated_status
 from pretorin.cli.output import is_json_mode, print_json
 from pretorin.client import PretorianClient
 from pretorin.client.api import AuthenticationError, NotFoundError, PretorianClientError
-from pretorin.client.models import ComplianceArtifact
+from pretorin.client.models import ComplianceArtifact, ControlDetail, ControlReferences
 
 app = typer.Typer()
 console = Console()
@@ -41,6 +41,22 @@ def handle_auth_error(error: AuthenticationError, show_login_hint: bool = True)
     raise typer.Exit(1)
 
 
+async def _fetch_control_and_references(
+    client: PretorianClient,
+    framework_id: str,
+    control_id: str,
+    brief: bool,
+) -> tuple[ControlDetail, ControlReferences | None]:
+    """Fetch a control and (unless brief) its references concurrently."""
+    if brief:
+        return await client.get_control(framework_id, control_id), None
+    control, refs = await asyncio.gather(
+        client.get_control(framework_id, control_id),
+        client.get_control_references(framework_id, control_id),
+    )
+    return control, refs
+
+
 # =============================================================================
 # Framework Commands
 # =============================================================================
@@ -352,8 +368,7 @@ def control_get(
 
             try:
                 if is_json_mode():
-                    control = await client.get_control(framework_id, control_id)
-                    refs = await client.get_control_references(framework_id, control_id) if not brief else None
+                    control, refs = await _fetch_control_and_references(client, framework_id, control_id, brief)
                     data: dict[str, Any] = control.model_dump(mode="json")
                     if refs:
                         data["references"] = refs.model_dump(mode="json")
@@ -361,10 +376,7 @@ def control_get(
                     return
 
                 with animated_status("Looking up control details...", AnimationTheme.SEARCHING):
-                    control = await client.get_control(framework_id, control_id)
-                    refs = None
-                    if not brief:
-                        refs = await client.get_control_references(framework_id, control_id)
+                    control, refs = await _fetch_control_and_references(client, framework_id, control_id, brief)
 
                 # Build control info
                 info_lines = [
@@ -595,10 +595,11 @@ async def _context_set(
 
                 delete_snapshot(old_system_id, old_framework_id)
 
-        config.set("active_system_id", system_id)
-        config.set("active_system_name", system_name)
-        config.set("active_framework_id", target_framework_id)
-        config.context_api_base_url = config.platform_api_base_url
+        with config.batch():
+            config.set("active_system_id", system_id)
+            config.set("active_system_name", system_name)
+            config.set("active_framework_id", target_framework_id)
+            config.context_api_base_url = config.platform_api_base_url
 
         if is_json_mode():
             print_json(
@@ -798,10 +799,11 @@ def context_clear() -> None:
 
         delete_snapshot(system_id, framework_id)
 
-    config.delete("active_system_id")
-    config.delete("active_system_name")
-    config.delete("active_framework_id")
-    config.delete("context_api_base_url")
+    with config.batch():
+        config.delete("active_system_id")
+        config.delete("active_system_name")
+        config.delete("active_framework_id")
+        config.delete("context_api_base_url")
 
     if is_json_mode():
         print_json({"cleared": True})
@@ -9,8 +9,7 @@ from rich import print as rprint
 from rich.panel import Panel
 
 from pretorin.cli.output import is_json_mode, print_json
-from pretorin.mcp.helpers import VALID_CONTROL_STATUSES
-from pretorin.utils import normalize_control_id
+from pretorin.utils import VALID_CONTROL_STATUSES, normalize_control_id
 
 app = typer.Typer(
     name="control",
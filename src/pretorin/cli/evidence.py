@@ -11,7 +11,7 @@ from rich.panel import Panel
 from rich.table import Table
 
 from pretorin.cli.output import is_json_mode, print_json
-from pretorin.mcp.helpers import VALID_EVIDENCE_TYPES
+from pretorin.evidence.types import VALID_EVIDENCE_TYPES
 from pretorin.utils import normalize_control_id
 
 console = Console()
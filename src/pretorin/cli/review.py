@@ -210,8 +210,10 @@ async def _run_review(
                 disable=is_json_mode(),
             ) as progress:
                 progress.add_task("Loading control requirements...", total=None)
-                control_detail = await client.get_control(resolved_framework_id, control_id)
-                control_refs = await client.get_control_references(resolved_framework_id, control_id)
+                control_detail, control_refs = await asyncio.gather(
+                    client.get_control(resolved_framework_id, control_id),
+                    client.get_control_references(resolved_framework_id, control_id),
+                )
         except PretorianClientError as e:
             rprint(f"[red]Failed to fetch control: {e.message}[/red]")
             raise typer.Exit(1)
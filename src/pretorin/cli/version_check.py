@@ -44,14 +44,11 @@ def _parse_version(version: str) -> tuple[int, ...]:
 
 def _load_cache() -> dict[str, Any]:
     """Load the version cache file."""
-    if VERSION_CACHE_FILE.exists():
-        try:
-            with open(VERSION_CACHE_FILE) as f:
-                result: dict[str, Any] = json.load(f)
-                return result
-        except (json.JSONDecodeError, OSError):
-            pass
-    return {}
+    try:
+        result: dict[str, Any] = json.loads(VERSION_CACHE_FILE.read_bytes())
+        return result
+    except (ValueError, OSError):
+        return {}
 
 
 def _save_cache(data: dict[str, Any]) -> None:
@@ -1,13 +1,47 @@
-"""Shared client library for Pretorin API."""
+"""Shared client library for Pretorin API.
 
-from pretorin.client.api import PretorianClient
-from pretorin.client.auth import clear_credentials, get_credentials, store_credentials
-from pretorin.client.config import Config
+Exports are resolved lazily so that importing ``pretorin.client.config``
+(or anything else that only needs configuration) does not pull in the
+HTTP client, the Pydantic models, and their import cost.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pretorin.client.api import PretorianClient
+    from pretorin.client.auth import clear_credentials, get_credentials, store_credentials
+    from pretorin.client.config import Config, get_config
+
+_EXPORTS = {
+    "PretorianClient": "pretorin.client.api",
+    "Config": "pretorin.client.config",
+    "get_config": "pretorin.client.config",
+    "get_credentials": "pretorin.client.auth",
+    "store_credentials": "pretorin.client.auth",
+    "clear_credentials": "pretorin.client.auth",
+}
 
 __all__ = [
     "PretorianClient",
     "Config",
+    "get_config",
     "get_credentials",
     "store_credentials",
     "clear_credentials",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -3,7 +3,17 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import hashlib
+import json
 import logging
+import os
+import re
+import tempfile
+import time
+from collections.abc import Mapping
+from pathlib import Path
+from types import MappingProxyType
 from typing import Any, cast
 
 import httpx
@@ -11,6 +21,10 @@ import httpx
 from pretorin import __version__
 from pretorin.client.config import Config
 from pretorin.client.models import (
+    CONTROL_FAMILY_SUMMARY_LIST_ADAPTER,
+    CONTROL_METADATA_MAP_ADAPTER,
+    CONTROL_SUMMARY_LIST_ADAPTER,
+    EVIDENCE_ITEM_LIST_ADAPTER,
     ComplianceArtifact,
     ControlBatchResponse,
     ControlContext,
@@ -112,6 +126,150 @@ _MAX_RETRIES = 3
 _BACKOFF_BASE = 1.0
 _BACKOFF_MULTIPLIER = 2.0
 
+# Upper bound on in-flight requests when fanning out per-control fetches.
+_BULK_CONCURRENCY = 10
+
+# Response bodies / item counts above which decoding and validation are moved
+# off the event loop thread with asyncio.to_thread.
+_OFFLOAD_DECODE_BYTES = 64 * 1024
+_OFFLOAD_VALIDATE_ITEMS = 500
+
+# Read size used when hashing evidence files before upload.
+_UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# On-disk cache for framework reference data (revalidated with ETags).
+RESPONSE_CACHE_DIR = Path.home() / ".pretorin" / "cache"
+# Only the read-only reference endpoints are cached: the framework catalog,
+# framework metadata, families, controls, control references, and document
+# requirements. Custom-framework authoring endpoints (drafts, revisions) are
+# never cached.
+_CACHEABLE_PATH_RE = re.compile(
+    r"^/frameworks"
+    r"(?:/controls/metadata"
+    r"|/[^/]+(?:/families(?:/[^/]+)?|/controls(?:/[^/]+(?:/references)?)?|/documents)?)?$"
+)
+# POSTs under /frameworks that only read data and leave the cache valid.
+_READ_ONLY_FRAMEWORK_POST_RE = re.compile(r"^/frameworks/[^/]+/controls/batch$")
+# Entries beyond this count are evicted, least recently stored first.
+RESPONSE_CACHE_MAX_ENTRIES = 512
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+def _response_cache_key(base_url: str, api_key: str | None, path: str, params: Any) -> str:
+    """Return the cache entry name for a GET request, keyed on target, identity, and params."""
+    items = sorted((str(k), str(v)) for k, v in dict(params or {}).items())
+    key = json.dumps([base_url, api_key or "", path, items])
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def _load_cache_meta(key: str) -> dict[str, Any] | None:
+    """Load an entry's metadata plus its body size, ignoring missing or corrupt entries."""
+    try:
+        meta = json.loads((RESPONSE_CACHE_DIR / f"{key}.meta").read_bytes())
+        size = (RESPONSE_CACHE_DIR / f"{key}.json").stat().st_size
+    except (OSError, ValueError):
+        return None
+    if not isinstance(meta, dict) or not {"etag", "max_age", "stored_at"} <= meta.keys():
+        return None
+    meta["size"] = size
+    return meta
+
+
+def _load_cached_body(key: str) -> Any:
+    """Decode an entry's body, or return None if it is missing or corrupt."""
+    try:
+        return json.loads((RESPONSE_CACHE_DIR / f"{key}.json").read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+async def _read_cached_body(key: str, size: int) -> Any:
+    """Decode an entry's body, on a worker thread when it is large."""
+    if size > _OFFLOAD_DECODE_BYTES:
+        return await asyncio.to_thread(_load_cached_body, key)
+    return _load_cached_body(key)
+
+
+def _write_cache_file(path: Path, data: bytes) -> None:
+    """Write a cache file owner-only (0600) via a temp file and ``os.replace``."""
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".entry.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        raise
+
+
+def _save_cache_meta(key: str, etag: str, max_age: float) -> None:
+    """Persist an entry's metadata. Failures are ignored — the cache is best-effort."""
+    meta = {"etag": etag, "max_age": max_age, "stored_at": time.time()}
+    with contextlib.suppress(OSError):
+        _write_cache_file(RESPONSE_CACHE_DIR / f"{key}.meta", json.dumps(meta).encode())
+
+
+def _save_cached_response(key: str, etag: str, max_age: float, body: bytes) -> None:
+    """Persist a response body as received, then its metadata, then evict old entries.
+
+    The metadata is written last so a reader never sees metadata without its
+    body. Failures are ignored — the cache is best-effort.
+    """
+    try:
+        _write_cache_file(RESPONSE_CACHE_DIR / f"{key}.json", body)
+    except OSError:
+        return
+    _save_cache_meta(key, etag, max_age)
+    _prune_response_cache()
+
+
+def _discard_cache_entry(key: str) -> None:
+    """Remove one entry (metadata first, so it is never half-visible)."""
+    for suffix in (".meta", ".json"):
+        with contextlib.suppress(OSError):
+            (RESPONSE_CACHE_DIR / f"{key}{suffix}").unlink()
+
+
+def _prune_response_cache() -> None:
+    """Evict the least recently stored entries beyond ``RESPONSE_CACHE_MAX_ENTRIES``."""
+    try:
+        metas = [(entry.stat().st_mtime_ns, entry.stem) for entry in RESPONSE_CACHE_DIR.glob("*.meta")]
+    except OSError:
+        return
+    if len(metas) <= RESPONSE_CACHE_MAX_ENTRIES:
+        return
+    metas.sort()
+    for _, key in metas[: len(metas) - RESPONSE_CACHE_MAX_ENTRIES]:
+        _discard_cache_entry(key)
+
+
+def clear_response_cache() -> int:
+    """Drop every cached framework response and return how many were removed.
+
+    Failures are ignored.
+    """
+    try:
+        entries = list(RESPONSE_CACHE_DIR.iterdir())
+    except OSError:
+        return 0
+    removed = 0
+    for entry in entries:
+        with contextlib.suppress(OSError):
+            entry.unlink()
+            removed += entry.suffix == ".meta"
+    return removed
+
+
+def _cache_max_age(response: httpx.Response) -> float:
+    """Extract ``Cache-Control: max-age`` in seconds (0 when absent or no-cache)."""
+    cache_control = response.headers.get("Cache-Control", "").lower()
+    if "no-cache" in cache_control or "no-store" in cache_control:
+        return 0.0
+    match = _MAX_AGE_RE.search(cache_control)
+    return float(match.group(1)) if match else 0.0
+
 
 class PretorianClient:
     """Async client for the Pretorin API."""
@@ -133,6 +291,7 @@ class PretorianClient:
         self._api_key = api_key or config.api_key
         self._api_base_url = (api_base_url or config.api_base_url).rstrip("/")
         self._timeout = timeout
+        self._headers = MappingProxyType(self._build_headers())
         self._client: httpx.AsyncClient | None = None
 
     @property
@@ -145,8 +304,8 @@ class PretorianClient:
         """Check if the client has an API key configured."""
         return self._api_key is not None
 
-    def _get_headers(self) -> dict[str, str]:
-        """Get request headers including authentication."""
+    def _build_headers(self) -> dict[str, str]:
+        """Build request headers including authentication."""
         headers = {
             "Content-Type": "application/json",
             "Accept": "application/json",
@@ -156,6 +315,10 @@ class PretorianClient:
             headers["Authorization"] = f"Bearer {self._api_key}"
         return headers
 
+    def _get_headers(self) -> Mapping[str, str]:
+        """Get the request headers, computed once at construction (read-only)."""
+        return self._headers
+
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create the async HTTP client."""
         if self._client is None or self._client.is_closed:
@@ -182,15 +345,21 @@ class PretorianClient:
 
     def _handle_error(self, response: httpx.Response) -> None:
         """Handle error responses from the API."""
-        try:
-            data = response.json()
-            # FastAPI returns {"detail": "message"} for errors
-            if isinstance(data, dict):
-                message = data.get("detail") or data.get("message") or str(data)
-            else:
-                message = str(data)
-            details = data if isinstance(data, dict) else {}
-        except Exception:
+        # Only JSON objects/arrays are worth decoding; HTML error pages from
+        # proxies and plain-text bodies skip the parse attempt entirely.
+        if response.content.lstrip()[:1] in (b"{", b"["):
+            try:
+                data = response.json()
+                # FastAPI returns {"detail": "message"} for errors
+                if isinstance(data, dict):
+                    message = data.get("detail") or data.get("message") or str(data)
+                else:
+                    message = str(data)
+                details = data if isinstance(data, dict) else {}
+            except ValueError:
+                message = response.text or f"HTTP {response.status_code}"
+                details = {}
+        else:
             message = response.text or f"HTTP {response.status_code}"
             details = {}
 
@@ -223,6 +392,8 @@ class PretorianClient:
         self,
         method: str,
         path: str,
+        *,
+        decode_json: bool = True,
         **kwargs: Any,
     ) -> dict[str, Any] | list[Any]:
         """Make an API request with automatic retry on transient failures.
@@ -232,9 +403,17 @@ class PretorianClient:
         responses the ``Retry-After`` header is respected when present.
         Non-retryable 4xx errors are raised immediately.
 
+        GETs of framework reference data are cached on disk when the server
+        sends an ``ETag``: entries within their ``max-age`` are served without
+        a request, older ones are revalidated with ``If-None-Match`` and reused
+        on ``304 Not Modified``. A successful write under ``/frameworks``
+        (publishing, forking, or rebasing a custom framework) clears the cache.
+
         Args:
             method: HTTP method.
             path: API path (relative to base URL).
+            decode_json: When False the body is not parsed (and the response
+                cache is bypassed); an empty dict is returned on success.
             **kwargs: Additional arguments to pass to httpx.
 
         Returns:
@@ -244,15 +423,35 @@ class PretorianClient:
             PretorianClientError: If the request fails after all retries.
             RateLimitError: If rate-limited and retries are exhausted.
         """
+        cache_key: str | None = None
+        cached: dict[str, Any] | None = None
+        request_kwargs = kwargs
+        if decode_json and method == "GET" and _CACHEABLE_PATH_RE.match(path):
+            cache_key = _response_cache_key(self._api_base_url, self._api_key, path, kwargs.get("params"))
+            cached = _load_cache_meta(cache_key)
+            if cached is not None:
+                if time.time() - float(cached["stored_at"]) < float(cached["max_age"]):
+                    cached_body = await _read_cached_body(cache_key, cached["size"])
+                    if cached_body is not None:
+                        logger.debug("API cache hit: %s %s", method, path)
+                        return cast(dict[str, Any] | list[Any], cached_body)
+                    cached = None
+                else:
+                    headers = {**(kwargs.get("headers") or {}), "If-None-Match": cached["etag"]}
+                    request_kwargs = {**kwargs, "headers": headers}
+
         last_exc: Exception | None = None
         backoff = _BACKOFF_BASE
+        # Build the request once: URL, header, and param merging happen here
+        # rather than inside every retry, and the same object is re-sent.
+        request = (await self._get_client()).build_request(method, path, **request_kwargs)
 
         for attempt in range(_MAX_RETRIES + 1):  # attempt 0 is the initial try
             logger.debug("API request: %s %s (attempt %d/%d)", method, path, attempt + 1, _MAX_RETRIES + 1)
             client = await self._get_client()
 
             try:
-                response = await client.request(method, path, **kwargs)
+                response = await client.send(request)
             except httpx.ConnectError as exc:
                 last_exc = PretorianClientError(
                     f"Could not connect to {self._api_base_url}{path} — is the API reachable? ({exc})",
@@ -297,6 +496,17 @@ class PretorianClient:
                 logger.warning("HTTP error: %s %s — %s", method, path, exc)
                 raise last_exc from exc
 
+            if response.status_code == 304 and cache_key is not None and cached is not None:
+                revalidated_body = await _read_cached_body(cache_key, cached["size"])
+                if revalidated_body is None:
+                    # The body vanished after the metadata was read; refetch.
+                    _discard_cache_entry(cache_key)
+                    return await self._request(method, path, decode_json=decode_json, **kwargs)
+                logger.debug("API cache revalidated: %s %s", method, path)
+                # Only the freshness metadata changes; the body file is kept as is.
+                _save_cache_meta(cache_key, cached["etag"], _cache_max_age(response))
+                return cast(dict[str, Any] | list[Any], revalidated_body)
+
             # ---- Handle HTTP-level errors ----
             if not response.is_success:
                 # Retryable server errors (502/503/504)
@@ -347,10 +557,29 @@ class PretorianClient:
                 self._handle_error(response)
 
             # ---- Success ----
-            if response.status_code == 204:
+            if method != "GET" and path.startswith("/frameworks") and not _READ_ONLY_FRAMEWORK_POST_RE.match(path):
+                # Framework catalog, metadata, and revisions may have changed.
+                clear_response_cache()
+
+            if response.status_code == 204 or not decode_json:
                 return {}
 
-            result: dict[str, Any] | list[Any] = response.json()
+            result: dict[str, Any] | list[Any]
+            if len(response.content) > _OFFLOAD_DECODE_BYTES:
+                # Large bodies are decoded on a worker thread so concurrent
+                # requests on the event loop keep making progress.
+                result = await asyncio.to_thread(json.loads, response.content)
+            else:
+                result = response.json()
+            etag = response.headers.get("ETag")
+            if cache_key is not None and etag and "no-store" not in response.headers.get("Cache-Control", ""):
+                # The raw body is stored as received, so nothing is re-encoded.
+                if len(response.content) > _OFFLOAD_DECODE_BYTES:
+                    await asyncio.to_thread(
+                        _save_cached_response, cache_key, etag, _cache_max_age(response), response.content
+                    )
+                else:
+                    _save_cached_response(cache_key, etag, _cache_max_age(response), response.content)
             return result
 
         # Should be unreachable, but satisfy the type checker.
@@ -398,8 +627,9 @@ class PretorianClient:
         if not self._api_key:
             raise AuthenticationError("No API key configured")
 
-        # Use frameworks endpoint as a lightweight validation check
-        await self._request_dict("GET", "/frameworks")
+        # Use frameworks endpoint as a lightweight validation check. Only the
+        # status matters, so the body is not decoded and the cache is skipped.
+        await self._request("GET", "/frameworks", decode_json=False)
         return True
 
     # =========================================================================
@@ -413,7 +643,7 @@ class PretorianClient:
             FrameworkList containing all frameworks with summary info.
         """
         data = await self._request_dict("GET", "/frameworks")
-        return FrameworkList(**data)
+        return FrameworkList.model_validate(data)
 
     async def get_framework(self, framework_id: str) -> FrameworkMetadata:
         """Get detailed metadata about a specific framework.
@@ -425,7 +655,7 @@ class PretorianClient:
             FrameworkMetadata with full framework details.
         """
         data = await self._request_dict("GET", f"/frameworks/{framework_id}")
-        return FrameworkMetadata(**data)
+        return FrameworkMetadata.model_validate(data)
 
     # =========================================================================
     # Control Family Endpoints
@@ -441,7 +671,7 @@ class PretorianClient:
             List of control family summaries.
         """
         data = await self._request_list("GET", f"/frameworks/{framework_id}/families")
-        return [ControlFamilySummary(**item) for item in data]
+        return CONTROL_FAMILY_SUMMARY_LIST_ADAPTER.validate_python(data)
 
     async def get_control_family(self, framework_id: str, family_id: str) -> ControlFamilyDetail:
         """Get detailed information about a control family.
@@ -454,7 +684,7 @@ class PretorianClient:
             ControlFamilyDetail with family info and controls list.
         """
         data = await self._request_dict("GET", f"/frameworks/{framework_id}/families/{family_id}")
-        return ControlFamilyDetail(**data)
+        return ControlFamilyDetail.model_validate(data)
 
     # =========================================================================
     # Control Endpoints
@@ -479,7 +709,7 @@ class PretorianClient:
             params["family_id"] = family_id
 
         data = await self._request_list("GET", f"/frameworks/{framework_id}/controls", params=params)
-        return [ControlSummary(**item) for item in data]
+        return CONTROL_SUMMARY_LIST_ADAPTER.validate_python(data)
 
     async def get_control(self, framework_id: str, control_id: str) -> ControlDetail:
         """Get detailed information about a specific control.
@@ -493,7 +723,35 @@ class PretorianClient:
         """
         normalized_control_id = self._normalize_control_id(control_id)
         data = await self._request_dict("GET", f"/frameworks/{framework_id}/controls/{normalized_control_id}")
-        return ControlDetail(**data)
+        return ControlDetail.model_validate(data)
+
+    async def get_controls_bulk(
+        self,
+        framework_id: str,
+        control_ids: list[str],
+        *,
+        concurrency: int = _BULK_CONCURRENCY,
+    ) -> list[ControlDetail]:
+        """Fetch several controls concurrently, preserving input order.
+
+        Requests overlap on the event loop (bounded by ``concurrency``) so N
+        lookups cost roughly N / concurrency round trips instead of N.
+
+        Args:
+            framework_id: ID of the framework.
+            control_ids: IDs of the controls to fetch.
+            concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            ControlDetail for each requested control, in input order.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _fetch(control_id: str) -> ControlDetail:
+            async with semaphore:
+                return await self.get_control(framework_id, control_id)
+
+        return list(await asyncio.gather(*(_fetch(control_id) for control_id in control_ids)))
 
     async def get_controls_batch(
         self,
@@ -507,7 +765,7 @@ class PretorianClient:
         if control_ids:
             payload["control_ids"] = [normalize_control_id(control_id) for control_id in control_ids]
         data = await self._request_dict("POST", f"/frameworks/{framework_id}/controls/batch", json=payload)
-        return ControlBatchResponse(**data)
+        return ControlBatchResponse.model_validate(data)
 
     async def get_control_references(self, framework_id: str, control_id: str) -> ControlReferences:
         """Get reference data for a control including guidance and objectives.
@@ -524,7 +782,7 @@ class PretorianClient:
             "GET",
             f"/frameworks/{framework_id}/controls/{normalized_control_id}/references",
         )
-        return ControlReferences(**data)
+        return ControlReferences.model_validate(data)
 
     async def get_controls_metadata(self, framework_id: str | None = None) -> dict[str, ControlMetadata]:
         """Get metadata for controls.
@@ -543,7 +801,9 @@ class PretorianClient:
             path = "/frameworks/controls/metadata"
 
         data = await self._request_dict("GET", path)
-        return {k: ControlMetadata(**v) for k, v in data.items()}
+        if len(data) > _OFFLOAD_VALIDATE_ITEMS:
+            return await asyncio.to_thread(CONTROL_METADATA_MAP_ADAPTER.validate_python, data)
+        return CONTROL_METADATA_MAP_ADAPTER.validate_python(data)
 
     # =========================================================================
     # Document Requirements
@@ -559,7 +819,7 @@ class PretorianClient:
             DocumentRequirementList with explicit and implicit requirements.
         """
         data = await self._request_dict("GET", f"/frameworks/{framework_id}/documents")
-        return DocumentRequirementList(**data)
+        return DocumentRequirementList.model_validate(data)
 
     # =========================================================================
     # Compliance Artifacts
@@ -577,21 +837,25 @@ class PretorianClient:
         Raises:
             PretorianClientError: If the submission fails.
         """
-        payload = artifact.model_dump()
-        if payload.get("control_id"):
-            payload["control_id"] = normalize_control_id(payload["control_id"])
-        component = payload.get("component")
-        if isinstance(component, dict):
-            implementations = component.get("control_implementations")
-            if isinstance(implementations, list):
-                for implementation in implementations:
-                    if isinstance(implementation, dict) and implementation.get("control_id"):
-                        implementation["control_id"] = normalize_control_id(implementation["control_id"])
+        # Normalize control IDs on shallow model copies, then serialize once in
+        # pydantic-core instead of model_dump() followed by httpx's json encoder.
+        implementations = [
+            implementation.model_copy(update={"control_id": normalize_control_id(implementation.control_id)})
+            if implementation.control_id
+            else implementation
+            for implementation in artifact.component.control_implementations
+        ]
+        normalized = artifact.model_copy(
+            update={
+                "control_id": normalize_control_id(artifact.control_id) if artifact.control_id else artifact.control_id,
+                "component": artifact.component.model_copy(update={"control_implementations": implementations}),
+            }
+        )
 
         data = await self._request_dict(
             "POST",
             "/artifacts",
-            json=payload,
+            content=normalized.model_dump_json(),
         )
         return data
 
@@ -620,7 +884,7 @@ class PretorianClient:
             SystemDetail with full system information.
         """
         data = await self._request_dict("GET", f"/systems/{system_id}")
-        return SystemDetail(**data)
+        return SystemDetail.model_validate(data)
 
     async def get_system_compliance_status(self, system_id: str) -> dict[str, Any]:
         """Get compliance status for a system.
@@ -662,7 +926,7 @@ class PretorianClient:
             params["control_id"] = normalize_control_id(control_id)
         data = await self._request("GET", f"/systems/{system_id}/evidence", params=params)
         items: list[Any] = data if isinstance(data, list) else data.get("items", data.get("evidence", []))
-        return [EvidenceItemResponse(**item) for item in items]
+        return EVIDENCE_ITEM_LIST_ADAPTER.validate_python(items)
 
     async def get_evidence(self, evidence_id: str) -> EvidenceItemResponse:
         """Get a specific evidence item.
@@ -674,7 +938,7 @@ class PretorianClient:
             Evidence item details.
         """
         data = await self._request_dict("GET", f"/evidence/{evidence_id}")
-        return EvidenceItemResponse(**data)
+        return EvidenceItemResponse.model_validate(data)
 
     async def create_evidence(
         self,
@@ -726,7 +990,7 @@ class PretorianClient:
         if sv is not None:
             payload["source_verification"] = sv
         data = await self._request_dict("POST", f"/systems/{system_id}/evidence/batch", json=payload)
-        return EvidenceBatchResponse(**data)
+        return EvidenceBatchResponse.model_validate(data)
 
     async def upload_evidence(
         self,
@@ -744,15 +1008,19 @@ class PretorianClient:
         Computes SHA-256 checksum locally and sends for server-side verification.
         Includes source_verification from the attested snapshot.
         """
-        import hashlib
         import json as json_mod
         import os
+        import stat
 
-        # Client-side file validation.
-        if not os.path.isfile(file_path):
+        # Client-side file validation (a single stat covers existence, type, and size).
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
             raise PretorianClientError(f"File not found: {file_path}")
 
-        file_size = os.path.getsize(file_path)
+        file_size = st.st_size
         max_size = 25 * 1024 * 1024  # 25 MB
         if file_size > max_size:
             raise PretorianClientError(f"File size ({file_size} bytes) exceeds the 25MB limit.")
@@ -764,18 +1032,10 @@ class PretorianClient:
         if ext in blocked:
             raise PretorianClientError(f"File extension '{ext}' is not allowed.")
 
-        # Compute SHA-256 checksum.
-        sha256 = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                sha256.update(chunk)
-        checksum = sha256.hexdigest()
-
         # Build query params.
         params: dict[str, str] = {
             "name": name,
             "evidence_type": evidence_type,
-            "checksum": checksum,
         }
         if description:
             params["description"] = description
@@ -791,10 +1051,16 @@ class PretorianClient:
         if sv is not None:
             params["source_verification"] = json_mod.dumps(sv, default=str)
 
-        # Multipart upload.
+        # Multipart upload. The file is opened once: hashed for the SHA-256
+        # checksum, rewound, then streamed by httpx without buffering it whole.
         file_name = os.path.basename(file_path)
         client = await self._get_client()
         with open(file_path, "rb") as f:
+            sha256 = hashlib.sha256()
+            for chunk in iter(lambda: f.read(_UPLOAD_CHUNK_SIZE), b""):
+                sha256.update(chunk)
+            params["checksum"] = sha256.hexdigest()
+            f.seek(0)
             response = await client.post(
                 f"/systems/{system_id}/evidence/upload",
                 params=params,
@@ -868,7 +1134,7 @@ class PretorianClient:
             f"/systems/{system_id}/controls/{normalized_control_id}/narrative",
             params=params,
         )
-        return NarrativeResponse(**data)
+        return NarrativeResponse.model_validate(data)
 
     # =========================================================================
     # Control Implementation Endpoints
@@ -897,7 +1163,7 @@ class PretorianClient:
             f"/systems/{system_id}/controls/{normalized_control_id}",
             params=params,
         )
-        return ControlImplementationResponse(**data)
+        return ControlImplementationResponse.model_validate(data)
 
     async def get_control_context(
         self,
@@ -921,7 +1187,7 @@ class PretorianClient:
             f"/systems/{system_id}/controls/{normalized_control_id}/context",
             params={"framework_id": framework_id},
         )
-        return ControlContext(**data)
+        return ControlContext.model_validate(data)
 
     async def update_narrative(
         self,
@@ -973,7 +1239,7 @@ class PretorianClient:
             f"/systems/{system_id}/scope",
             params={"framework_id": framework_id},
         )
-        return ScopeResponse(**data)
+        return ScopeResponse.model_validate(data)
 
     async def patch_scope_qa(
         self,
@@ -988,17 +1254,17 @@ class PretorianClient:
             params={"framework_id": framework_id},
             json={"updates": updates},
         )
-        return ScopeResponse(**data)
+        return ScopeResponse.model_validate(data)
 
     async def list_org_policies(self) -> OrgPolicyListResponse:
         """List org policies for the current token's organization."""
         data = await self._request_dict("GET", "/org-policies")
-        return OrgPolicyListResponse(**data)
+        return OrgPolicyListResponse.model_validate(data)
 
     async def get_org_policy_questionnaire(self, policy_id: str) -> OrgPolicyQuestionnaireResponse:
         """Get canonical questionnaire state for one org policy."""
         data = await self._request_dict("GET", f"/org-policies/{policy_id}/qa")
-        return OrgPolicyQuestionnaireResponse(**data)
+        return OrgPolicyQuestionnaireResponse.model_validate(data)
 
     async def patch_org_policy_qa(
         self,
@@ -1011,7 +1277,7 @@ class PretorianClient:
             f"/org-policies/{policy_id}/qa",
             json={"updates": updates},
         )
-        return OrgPolicyQuestionnaireResponse(**data)
+        return OrgPolicyQuestionnaireResponse.model_validate(data)
 
     async def add_control_note(
         self,
@@ -1662,3 +1928,66 @@ class PretorianClient:
     async def list_revisions(self, framework_id: str) -> list[dict[str, Any]]:
         """List all revisions (drafts + published) for a framework."""
         return await self._request_list("GET", f"/frameworks/{framework_id}/revisions")
+
+
+# =============================================================================
+# Shared client for long-lived processes
+# =============================================================================
+
+# Each CLI command runs in its own short-lived process, but long-lived hosts
+# (the MCP server) make many calls per process.  Reusing one client there keeps
+# the httpx connection pool — and its TLS sessions — warm between calls.  An
+# httpx.AsyncClient cannot outlive the event loop that opened its connections,
+# so the shared instance is tied to the loop that created it.  It is also tied
+# to the configured credentials, so a `pretorin login` while the server runs
+# takes effect on the next call just as it did with a client per call.
+_shared_client: PretorianClient | None = None
+_shared_client_loop: asyncio.AbstractEventLoop | None = None
+# Clients replaced after a credential change.  Calls may still be using them,
+# so they are closed by close_shared_client() rather than when replaced.
+_retired_clients: list[PretorianClient] = []
+
+
+def get_shared_client() -> PretorianClient:
+    """Return the process-wide client for the running event loop.
+
+    A new client is created on first use, when called from a different
+    event loop than the cached one, or when the configured API key or base
+    URL no longer match it.  Credentials are resolved through ``Config()``,
+    which rereads the config file when it changes on disk, so a login from
+    another process is picked up.  A client replaced on the running loop is
+    kept until :func:`close_shared_client` so in-flight calls can finish; one
+    bound to another loop is dropped, since its connections cannot be closed
+    from here.  Callers must not close the returned client.
+    """
+    global _shared_client, _shared_client_loop
+
+    loop = asyncio.get_running_loop()
+    config = Config()
+    api_key = config.api_key
+    api_base_url = config.api_base_url.rstrip("/")
+    client = _shared_client
+    if (
+        client is None
+        or _shared_client_loop is not loop
+        or client._api_key != api_key
+        or client.api_base_url != api_base_url
+    ):
+        if client is not None and _shared_client_loop is loop:
+            _retired_clients.append(client)
+        client = _shared_client = PretorianClient(api_key=api_key, api_base_url=api_base_url)
+        _shared_client_loop = loop
+    return client
+
+
+async def close_shared_client() -> None:
+    """Close and forget the process-wide client and any it replaced."""
+    global _shared_client, _shared_client_loop
+
+    clients = [*_retired_clients, _shared_client]
+    _retired_clients.clear()
+    _shared_client = None
+    _shared_client_loop = None
+    for client in clients:
+        if client is not None:
+            await client.close()
@@ -7,7 +7,7 @@ from urllib.parse import urlsplit, urlunsplit
 from pretorin.client.config import (
     DEFAULT_MODEL_API_BASE_URL,
     DEFAULT_PLATFORM_API_BASE_URL,
-    Config,
+    get_config,
 )
 
 
@@ -17,7 +17,7 @@ def get_credentials() -> tuple[str | None, str]:
     Returns:
         Tuple of (api_key, api_base_url). api_key may be None if not configured.
     """
-    config = Config()
+    config = get_config()
     return config.api_key, config.api_base_url
 
 
@@ -28,7 +28,7 @@ def store_credentials(api_key: str, api_base_url: str | None = None) -> None:
         api_key: The API key to store.
         api_base_url: Optional custom API base URL.
     """
-    config = Config()
+    config = get_config()
     stored = config.to_dict()
     previous_api_key = stored.get("api_key")
     previous_api_base_url = stored.get("platform_api_base_url") or stored.get("api_base_url")
@@ -40,13 +40,14 @@ def store_credentials(api_key: str, api_base_url: str | None = None) -> None:
 
     context_changed = previous_api_key != api_key or previous_api_base_url != resolved_api_base_url
 
-    config.api_key = api_key
-    config.api_base_url = resolved_api_base_url
-    config.model_api_base_url = resolved_model_api_base_url
+    with config.batch():
+        config.api_key = api_key
+        config.api_base_url = resolved_api_base_url
+        config.model_api_base_url = resolved_model_api_base_url
 
-    if context_changed:
-        config.active_system_id = None
-        config.active_framework_id = None
+        if context_changed:
+            config.active_system_id = None
+            config.active_framework_id = None
 
 
 def _derive_model_api_base_url(api_base_url: str) -> str:
@@ -63,11 +64,11 @@ def _derive_model_api_base_url(api_base_url: str) -> str:
 
 def clear_credentials() -> None:
     """Clear all stored credentials."""
-    config = Config()
+    config = get_config()
     config.clear()
 
 
 def is_authenticated() -> bool:
     """Check if credentials are configured."""
-    config = Config()
+    config = get_config()
     return config.is_configured
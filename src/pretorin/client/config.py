@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import contextlib
 import json
 import os
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, cast
 
@@ -28,6 +32,70 @@ ENV_SOURCE_PROVIDERS = "PRETORIN_SOURCE_PROVIDERS"
 ENV_SOURCE_MANIFEST = "PRETORIN_SOURCE_MANIFEST"
 
 
+# Config keys overridden by environment variables, in precedence order.
+_PLATFORM_URL_ENV = (ENV_PLATFORM_API_BASE_URL, ENV_API_BASE_URL)
+_ENV_OVERRIDES: dict[str, tuple[str, ...]] = {
+    "api_key": (ENV_API_KEY,),
+    "api_base_url": _PLATFORM_URL_ENV,
+    "platform_api_base_url": _PLATFORM_URL_ENV,
+    "model_api_base_url": (ENV_MODEL_API_BASE_URL,),
+    "harness_base_url": (ENV_MODEL_API_BASE_URL,),
+    "codex_base_url": (ENV_MODEL_API_BASE_URL,),
+    "active_system_id": (ENV_SYSTEM_ID,),
+    "active_framework_id": (ENV_FRAMEWORK_ID,),
+}
+
+# Config keys whose environment override holds JSON.
+_JSON_ENV_OVERRIDES: dict[str, str] = {
+    "source_providers": ENV_SOURCE_PROVIDERS,
+    "source_manifest": ENV_SOURCE_MANIFEST,
+}
+
+# Parsed config files keyed by path, reused while the file's (mtime_ns, size)
+# signature is unchanged so repeated ``Config()`` calls cost a single stat.
+_LOAD_CACHE: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+
+# Sentinel for dict.pop so a stored ``None`` still counts as present.
+_MISSING = object()
+
+# Config directories already created by this process, so saves skip mkdir.
+_READY_DIRS: set[Path] = set()
+
+
+def _ensure_config_dir() -> None:
+    """Create ``CONFIG_DIR`` once per process (per path)."""
+    if CONFIG_DIR not in _READY_DIRS:
+        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        _READY_DIRS.add(CONFIG_DIR)
+
+
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    """Return ``(mtime_ns, size)`` for ``path``, or None if it cannot be stat'ed."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _read_config_file(path: Path) -> dict[str, Any]:
+    """Return the parsed config at ``path``, reparsing only when it changed on disk."""
+    signature = _file_signature(path)
+    if signature is None:
+        _LOAD_CACHE.pop(path, None)
+        return {}
+    cached = _LOAD_CACHE.get(path)
+    if cached is not None and cached[0] == signature:
+        return dict(cached[1])
+    try:
+        data: dict[str, Any] = json.loads(path.read_bytes())
+    except (ValueError, OSError):
+        return {}
+    _LOAD_CACHE[path] = (signature, data)
+    return dict(data)
+
+
 def _as_bool(value: Any) -> bool:
     """Interpret common truthy string values."""
     if isinstance(value, bool):
@@ -44,27 +112,109 @@ class Config:
     _org_cli_model: str | None = None
 
     def __init__(self) -> None:
-        self._config: dict[str, Any] = {}
-        self._load()
+        # Loaded lazily on first access so constructing a Config does no I/O.
+        self._data: dict[str, Any] | None = None
+        # Environment variables read so far, so repeated property access
+        # does not go back through os.environ for every lookup.
+        self._env_snapshot: dict[str, str | None] = {}
+        # Nesting depth of batch() blocks and whether a save is pending.
+        self._batch_depth = 0
+        self._dirty = False
+        # Resolved base URLs; cleared whenever stored values change.
+        self._url_cache: dict[str, str] = {}
+        # (mtime_ns, size) of the config file when it was last loaded or saved.
+        self._signature: tuple[int, int] | None = None
+
+    def _env(self, name: str) -> str | None:
+        """Return an environment variable, reading it at most once per instance."""
+        try:
+            return self._env_snapshot[name]
+        except KeyError:
+            value = self._env_snapshot[name] = os.environ.get(name)
+            return value
+
+    def _env_or_config(self, env_name: str, key: str) -> Any:
+        """Return ``env_name`` if set and non-empty, else the stored ``key``."""
+        return self._env(env_name) or self._config.get(key)
+
+    @property
+    def _config(self) -> dict[str, Any]:
+        if self._data is None:
+            self._load()
+        return cast(dict[str, Any], self._data)
+
+    @_config.setter
+    def _config(self, value: dict[str, Any]) -> None:
+        self._data = value
+        self._url_cache.clear()
+
+    def _cached_url(self, name: str, keys: tuple[str, ...], default: str) -> str:
+        """Resolve the first configured value among ``keys``, memoized per instance."""
+        url = self._url_cache.get(name)
+        if url is None:
+            url = default
+            for key in keys:
+                value = self.get(key)
+                if value:
+                    url = str(value)
+                    break
+            self._url_cache[name] = url
+        return url
 
     def _load(self) -> None:
         """Load configuration from file."""
-        if CONFIG_FILE.exists():
-            try:
-                with open(CONFIG_FILE) as f:
-                    self._config = json.load(f)
-            except (json.JSONDecodeError, OSError):
-                self._config = {}
-        else:
-            self._config = {}
+        self._signature = _file_signature(CONFIG_FILE)
+        self._data = _read_config_file(CONFIG_FILE)
+
+    def _refresh(self) -> None:
+        """Drop loaded state that no longer matches the config file or environment.
+
+        Lets a long-lived instance see edits made by other processes (such as
+        ``pretorin login`` in another terminal) and changed environment
+        variables.  Costs one stat; unsaved ``batch()`` changes are kept.
+        """
+        if self._batch_depth or self._dirty:
+            return
+        if self._data is not None and _file_signature(CONFIG_FILE) != self._signature:
+            self._data = None
+            self._url_cache.clear()
+        if any(os.environ.get(name) != value for name, value in self._env_snapshot.items()):
+            self._env_snapshot.clear()
+            self._url_cache.clear()
 
     def _save(self) -> None:
         """Save configuration to file."""
-        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(self._config, f, indent=2)
-        # Set restrictive permissions on config file (contains API key)
-        CONFIG_FILE.chmod(0o600)
+        # Serialize once and write in a single call; json.dump issues a write per token.
+        # Compact separators keep json on its C encoder (indent forces the Python one);
+        # `pretorin config list` is the human-readable view.
+        payload = json.dumps(self._config, separators=(",", ":")).encode()
+        # mkstemp creates the file 0o600, so the API key is never world-readable,
+        # and os.replace swaps it in atomically so readers never see a partial file.
+        _ensure_config_dir()
+        try:
+            fd, tmp_name = tempfile.mkstemp(dir=CONFIG_DIR, prefix=".config.", suffix=".tmp")
+        except FileNotFoundError:
+            # The directory was removed after we first created it.
+            _READY_DIRS.discard(CONFIG_DIR)
+            _ensure_config_dir()
+            fd, tmp_name = tempfile.mkstemp(dir=CONFIG_DIR, prefix=".config.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_name, CONFIG_FILE)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+            raise
+        st = os.stat(CONFIG_FILE)
+        self._signature = (st.st_mtime_ns, st.st_size)
+        _LOAD_CACHE[CONFIG_FILE] = (self._signature, dict(self._config))
+        self._sync_shared()
+
+    def _sync_shared(self) -> None:
+        """Propagate this instance's data to the shared ``get_config()`` instance."""
+        if _shared_config is not None and _shared_config is not self and _shared_config_file == CONFIG_FILE:
+            _shared_config._config = dict(self._config)
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value.
@@ -72,65 +222,66 @@ class Config:
         Environment variables take precedence over stored config.
         """
         # Check environment variables first
-        if key == "api_key":
-            env_value = os.environ.get(ENV_API_KEY)
-            if env_value:
-                return env_value
-        elif key in {"api_base_url", "platform_api_base_url"}:
-            env_value = os.environ.get(ENV_PLATFORM_API_BASE_URL) or os.environ.get(ENV_API_BASE_URL)
-            if env_value:
-                return env_value
-        elif key in {"model_api_base_url", "harness_base_url", "codex_base_url"}:
-            env_value = os.environ.get(ENV_MODEL_API_BASE_URL)
+        for env_name in _ENV_OVERRIDES.get(key, ()):
+            env_value = self._env(env_name)
             if env_value:
                 return env_value
-        elif key == "disable_update_check":
-            env_value = os.environ.get(ENV_DISABLE_UPDATE_CHECK)
+        if key == "disable_update_check":
+            # Any explicit value (even empty) overrides the stored setting.
+            env_value = self._env(ENV_DISABLE_UPDATE_CHECK)
             if env_value is not None:
                 return env_value
-        elif key == "active_system_id":
-            env_value = os.environ.get(ENV_SYSTEM_ID)
-            if env_value:
-                return env_value
-        elif key == "active_framework_id":
-            env_value = os.environ.get(ENV_FRAMEWORK_ID)
-            if env_value:
-                return env_value
-        elif key == "source_providers":
-            env_value = os.environ.get(ENV_SOURCE_PROVIDERS)
-            if env_value:
-                try:
-                    return json.loads(env_value)
-                except json.JSONDecodeError:
-                    pass
-        elif key == "source_manifest":
-            env_value = os.environ.get(ENV_SOURCE_MANIFEST)
+        elif key in _JSON_ENV_OVERRIDES:
+            env_value = self._env(_JSON_ENV_OVERRIDES[key])
             if env_value:
                 try:
                     return json.loads(env_value)
                 except json.JSONDecodeError:
-                    pass  # May be a file path, handled by load_manifest
+                    pass  # source_manifest may be a file path, handled by load_manifest
 
         return self._config.get(key, default)
 
+    def _persist(self) -> None:
+        """Save now, or mark dirty when inside a ``batch()`` block."""
+        self._url_cache.clear()
+        if self._batch_depth:
+            self._dirty = True
+        else:
+            self._save()
+
+    @contextmanager
+    def batch(self) -> Iterator[Config]:
+        """Group several ``set``/``delete`` calls into a single file write.
+
+        The file is saved once when the outermost block exits.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                self._dirty = False
+                self._save()
+
     def set(self, key: str, value: Any) -> None:
         """Set a configuration value and save to file."""
         self._config[key] = value
-        self._save()
+        self._persist()
 
     def delete(self, key: str) -> bool:
         """Delete a configuration value. Returns True if key existed."""
-        if key in self._config:
-            del self._config[key]
-            self._save()
-            return True
-        return False
+        if self._config.pop(key, _MISSING) is _MISSING:
+            return False
+        self._persist()
+        return True
 
     def clear(self) -> None:
         """Clear all configuration."""
         self._config = {}
-        if CONFIG_FILE.exists():
-            CONFIG_FILE.unlink()
+        _LOAD_CACHE.pop(CONFIG_FILE, None)
+        self._sync_shared()
+        CONFIG_FILE.unlink(missing_ok=True)
 
     @property
     def api_key(self) -> str | None:
@@ -145,20 +296,19 @@ class Config:
     @property
     def platform_api_base_url(self) -> str:
         """Get the Pretorin platform REST API base URL."""
-        configured = self.get("platform_api_base_url")
-        if configured:
-            return str(configured)
-        legacy = self.get("api_base_url")
-        if legacy:
-            return str(legacy)
-        return DEFAULT_PLATFORM_API_BASE_URL
+        return self._cached_url(
+            "platform",
+            ("platform_api_base_url", "api_base_url"),
+            DEFAULT_PLATFORM_API_BASE_URL,
+        )
 
     @platform_api_base_url.setter
     def platform_api_base_url(self, value: str) -> None:
         """Set the Pretorin platform REST API base URL."""
-        self.set("platform_api_base_url", value)
-        # Keep legacy key updated for compatibility with older installations.
-        self.set("api_base_url", value)
+        with self.batch():
+            self.set("platform_api_base_url", value)
+            # Keep legacy key updated for compatibility with older installations.
+            self.set("api_base_url", value)
 
     @property
     def api_base_url(self) -> str:
@@ -173,17 +323,13 @@ class Config:
     @property
     def model_api_base_url(self) -> str:
         """Get the model provider base URL used by harness integrations."""
-        configured = self.get("model_api_base_url")
-        if configured:
-            return str(configured)
-        # Backward-compatible keys used in previous harness prototypes.
-        legacy_harness = self.get("harness_base_url")
-        if legacy_harness:
-            return str(legacy_harness)
-        legacy_codex = self.get("codex_base_url")
-        if legacy_codex:
-            return str(legacy_codex)
-        return DEFAULT_MODEL_API_BASE_URL
+        # harness_base_url / codex_base_url are backward-compatible keys used
+        # in previous harness prototypes.
+        return self._cached_url(
+            "model",
+            ("model_api_base_url", "harness_base_url", "codex_base_url"),
+            DEFAULT_MODEL_API_BASE_URL,
+        )
 
     @model_api_base_url.setter
     def model_api_base_url(self, value: str) -> None:
@@ -230,9 +376,10 @@ class Config:
     def active_system_id(self, value: str | None) -> None:
         """Set the active system ID."""
         if value is None:
-            self.delete("active_system_id")
-            self.delete("active_system_name")
-            self.delete("context_api_base_url")
+            with self.batch():
+                self.delete("active_system_id")
+                self.delete("active_system_name")
+                self.delete("context_api_base_url")
         else:
             self.set("active_system_id", value)
 
@@ -285,14 +432,12 @@ class Config:
     @property
     def openai_api_key(self) -> str | None:
         """Get the OpenAI API key (env var takes precedence)."""
-        env = os.environ.get(ENV_OPENAI_API_KEY)
-        return env if env else cast(str | None, self.get("openai_api_key"))
+        return cast(str | None, self._env_or_config(ENV_OPENAI_API_KEY, "openai_api_key"))
 
     @property
     def openai_base_url(self) -> str | None:
         """Get the OpenAI base URL (env var takes precedence)."""
-        env = os.environ.get(ENV_OPENAI_BASE_URL)
-        return env if env else cast(str | None, self.get("openai_base_url"))
+        return cast(str | None, self._env_or_config(ENV_OPENAI_BASE_URL, "openai_base_url"))
 
     @property
     def openai_model(self) -> str:
@@ -304,12 +449,9 @@ class Config:
         3. Org AI settings fetched from the platform (cached)
         4. ``"gpt-4o"`` default
         """
-        env = os.environ.get(ENV_OPENAI_MODEL)
-        if env:
-            return env
-        local: str | None = self.get("openai_model")
-        if local:
-            return local
+        model: str | None = self._env_or_config(ENV_OPENAI_MODEL, "openai_model")
+        if model:
+            return model
         if self._org_cli_model is not None:
             return self._org_cli_model
         return "gpt-4o"
@@ -332,3 +474,31 @@ class Config:
     def to_dict(self) -> dict[str, Any]:
         """Return all stored config as a dictionary."""
         return dict(self._config)
+
+
+_shared_config: Config | None = None
+_shared_config_file: Path | None = None
+
+
+def get_config() -> Config:
+    """Return the process-wide Config, creating it on first use.
+
+    The instance is rebuilt if ``CONFIG_FILE`` points somewhere else, and
+    writes made through any other ``Config`` are mirrored into it.  On every
+    access it reloads if the file changed on disk or a consulted environment
+    variable changed, so edits from other processes are seen.
+    """
+    global _shared_config, _shared_config_file
+    if _shared_config is None or _shared_config_file != CONFIG_FILE:
+        _shared_config = Config()
+        _shared_config_file = CONFIG_FILE
+    else:
+        _shared_config._refresh()
+    return _shared_config
+
+
+def reset_config() -> None:
+    """Drop the shared Config so the next ``get_config()`` rebuilds it."""
+    global _shared_config, _shared_config_file
+    _shared_config = None
+    _shared_config_file = None
@@ -5,9 +5,62 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, Literal, cast
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 from typing_extensions import TypedDict
 
+__all__ = [
+    "FrameworkSummary",
+    "FrameworkList",
+    "FrameworkMetadata",
+    "ControlFamilySummary",
+    "ControlInFamily",
+    "ControlFamilyDetail",
+    "ControlSummary",
+    "ControlDetail",
+    "ControlMetadata",
+    "RelatedControl",
+    "ControlReferences",
+    "ControlBatchItem",
+    "ControlBatchResponse",
+    "DocumentRequirement",
+    "DocumentRequirementList",
+    "Evidence",
+    "ImplementationStatement",
+    "ComponentDefinition",
+    "ComplianceArtifact",
+    "ArtifactValidationResult",
+    "SystemDetail",
+    "EvidenceItemResponse",
+    "EvidenceCodeContext",
+    "SourceType",
+    "RedactionSummary",
+    "EvidenceAuditMetadata",
+    "EvidenceCreate",
+    "EvidenceBatchItemCreate",
+    "EvidenceBatchItemResult",
+    "EvidenceBatchResponse",
+    "NarrativeResponse",
+    "ControlImplementationResponse",
+    "ControlContext",
+    "ReviewGap",
+    "ReviewChange",
+    "PersistedReview",
+    "QuestionGuidance",
+    "ScopeQuestionDefinition",
+    "ScopeResponse",
+    "MonitoringEventCreate",
+    "PolicyTemplateSection",
+    "PolicyQuestionDefinition",
+    "PolicyTemplate",
+    "OrgPolicySummary",
+    "OrgPolicyListResponse",
+    "OrgPolicyQuestionnaireResponse",
+    "CONTROL_SUMMARY_LIST_ADAPTER",
+    "CONTROL_FAMILY_SUMMARY_LIST_ADAPTER",
+    "CONTROL_METADATA_MAP_ADAPTER",
+    "EVIDENCE_ITEM_LIST_ADAPTER",
+]
+
 # =============================================================================
 # Framework Models
 # =============================================================================
@@ -717,3 +770,15 @@ class OrgPolicyQuestionnaireResponse(BaseModel):
     template: PolicyTemplate | None = None
     policy_review: PersistedReview | None = None
     policy_reviewed_at: str | None = None
+
+
+# =============================================================================
+# Type Adapters
+# =============================================================================
+
+# Built once at import so list endpoints validate a whole payload with one
+# compiled core-schema validator instead of constructing models item by item.
+CONTROL_SUMMARY_LIST_ADAPTER: TypeAdapter[list[ControlSummary]] = TypeAdapter(list[ControlSummary])
+CONTROL_FAMILY_SUMMARY_LIST_ADAPTER: TypeAdapter[list[ControlFamilySummary]] = TypeAdapter(list[ControlFamilySummary])
+CONTROL_METADATA_MAP_ADAPTER: TypeAdapter[dict[str, ControlMetadata]] = TypeAdapter(dict[str, ControlMetadata])
+EVIDENCE_ITEM_LIST_ADAPTER: TypeAdapter[list[EvidenceItemResponse]] = TypeAdapter(list[EvidenceItemResponse])
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -10,10 +11,14 @@ from pretorin.client.api import PretorianClient
 from pretorin.evidence.audit_metadata import build_cli_metadata, evidence_type_to_source_type
 from pretorin.evidence.writer import EvidenceWriter, LocalEvidence, _format_frontmatter
 from pretorin.local_file import update_file_frontmatter
-from pretorin.workflows.compliance_updates import upsert_evidence
+from pretorin.utils import normalize_control_id
+from pretorin.workflows.compliance_updates import EvidenceUpsertResult, upsert_evidence
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of evidence upserts in flight during a push.
+_PUSH_CONCURRENCY = 8
+
 
 @dataclass
 class SyncResult:
@@ -38,10 +43,9 @@ class EvidenceSync:
         if system_id:
             self._system_id = system_id
         else:
-            from pretorin.client.config import Config
+            from pretorin.client.config import get_config
 
-            config = Config()
-            self._system_id = config.active_system_id or ""
+            self._system_id = get_config().active_system_id or ""
         if not self._system_id:
             raise ValueError("No active system set. Run: pretorin context set --system <id>")
         self.writer = EvidenceWriter(evidence_dir)
@@ -64,78 +68,52 @@ class EvidenceSync:
             SyncResult with counts of created/skipped/errored items.
         """
         result = SyncResult()
-        evidence_items = self.writer.list_local()
+        # Already-synced files are only needed for their label, so their
+        # bodies are not read.
+        evidence_items = self.writer.list_local(skip_synced_bodies=True)
         logger.debug("Starting evidence sync: %d local items found", len(evidence_items))
 
-        for ev in evidence_items:
+        # Items sharing a (framework, control) scope are pushed serially so the
+        # upsert dedupe lookup sees earlier creates; distinct scopes overlap.
+        # Control IDs are normalized the way the upsert does, so "AC-2" and
+        # "ac-02" share a group.
+        groups: dict[tuple[str, str], list[tuple[int, LocalEvidence]]] = {}
+        labels = [f"{ev.framework_id}/{ev.control_id}/{ev.name}" for ev in evidence_items]
+        for index, ev in enumerate(evidence_items):
             if ev.platform_id:
-                logger.debug("Skipping already-synced evidence: %s/%s/%s", ev.framework_id, ev.control_id, ev.name)
-                result.skipped.append(f"{ev.framework_id}/{ev.control_id}/{ev.name}")
+                logger.debug("Skipping already-synced evidence: %s", labels[index])
+                result.skipped.append(labels[index])
                 continue
 
             if dry_run:
-                result.created.append(f"[dry-run] {ev.framework_id}/{ev.control_id}/{ev.name}")
+                result.created.append(f"[dry-run] {labels[index]}")
                 continue
 
-            try:
-                code_context = {}
-                if ev.code_file_path:
-                    code_context["code_file_path"] = ev.code_file_path
-                if ev.code_line_numbers:
-                    code_context["code_line_numbers"] = ev.code_line_numbers
-                if ev.code_snippet:
-                    code_context["code_snippet"] = ev.code_snippet
-                if ev.code_repository:
-                    code_context["code_repository"] = ev.code_repository
-                if ev.code_commit_hash:
-                    code_context["code_commit_hash"] = ev.code_commit_hash
-
-                # WS1b: stamp audit-trail metadata. Source URI comes from the
-                # local evidence's code_file_path when present (the file the
-                # evidence references); else points at the platform context.
-                audit_source_uri = (
-                    f"file://{ev.code_file_path}"
-                    if ev.code_file_path
-                    else f"pretorin://systems/{self._system_id}/controls/{ev.control_id}"
-                )
-                audit = build_cli_metadata(
-                    body=ev.description,
-                    source_uri=audit_source_uri,
-                    source_type=evidence_type_to_source_type(ev.evidence_type),
-                    source_version=ev.code_commit_hash,
-                )
-
-                sync_result = await upsert_evidence(
-                    client,
-                    system_id=self._system_id,
-                    name=ev.name,
-                    description=ev.description,
-                    evidence_type=ev.evidence_type,
-                    source="cli",
-                    control_id=ev.control_id,
-                    framework_id=ev.framework_id,
-                    code_context=code_context or None,
-                    audit_metadata=audit,
-                )
-                platform_id = sync_result.evidence_id
-
-                if platform_id:
-                    if ev.path:
-                        # Update local file with platform_id
-                        ev.platform_id = platform_id
-                        self._update_frontmatter(ev)
-
-                label = f"{ev.framework_id}/{ev.control_id}/{ev.name}"
-                if sync_result.created:
-                    result.created.append(label)
-                else:
-                    result.reused.append(label)
-                if sync_result.link_error:
-                    result.errors.append(f"{label} link: {sync_result.link_error}")
-
-            except Exception as e:
-                logger.warning("Evidence sync error for %s/%s/%s: %s", ev.framework_id, ev.control_id, ev.name, e)
-                result.errors.append(f"{ev.framework_id}/{ev.control_id}/{ev.name}: {e}")
+            groups.setdefault((ev.framework_id, normalize_control_id(ev.control_id)), []).append((index, ev))
+
+        outcomes: dict[int, EvidenceUpsertResult | Exception] = {}
+        semaphore = asyncio.Semaphore(_PUSH_CONCURRENCY)
+
+        async def push_group(group: list[tuple[int, LocalEvidence]]) -> None:
+            async with semaphore:
+                for index, ev in group:
+                    outcomes[index] = await self._push_one(client, ev, labels[index])
+
+        await asyncio.gather(*(push_group(group) for group in groups.values()))
+
+        # Fold outcomes in file order so the result lists stay deterministic.
+        for index in sorted(outcomes):
+            outcome = outcomes[index]
+            label = labels[index]
+            if isinstance(outcome, Exception):
+                result.errors.append(f"{label}: {outcome}")
+                continue
+            if outcome.created:
+                result.created.append(label)
+            else:
+                result.reused.append(label)
+            if outcome.link_error:
+                result.errors.append(f"{label} link: {outcome.link_error}")
 
         logger.debug(
             "Evidence sync complete: created=%d reused=%d skipped=%d errors=%d",
@@ -146,6 +124,64 @@ class EvidenceSync:
         )
         return result
 
+    async def _push_one(
+        self, client: PretorianClient, ev: LocalEvidence, label: str
+    ) -> EvidenceUpsertResult | Exception:
+        """Upsert one evidence item, returning the outcome or the error raised."""
+        try:
+            code_context = {}
+            if ev.code_file_path:
+                code_context["code_file_path"] = ev.code_file_path
+            if ev.code_line_numbers:
+                code_context["code_line_numbers"] = ev.code_line_numbers
+            if ev.code_snippet:
+                code_context["code_snippet"] = ev.code_snippet
+            if ev.code_repository:
+                code_context["code_repository"] = ev.code_repository
+            if ev.code_commit_hash:
+                code_context["code_commit_hash"] = ev.code_commit_hash
+
+            # WS1b: stamp audit-trail metadata. Source URI comes from the
+            # local evidence's code_file_path when present (the file the
+            # evidence references); else points at the platform context.
+            audit_source_uri = (
+                f"file://{ev.code_file_path}"
+                if ev.code_file_path
+                else f"pretorin://systems/{self._system_id}/controls/{ev.control_id}"
+            )
+            audit = build_cli_metadata(
+                body=ev.description,
+                source_uri=audit_source_uri,
+                source_type=evidence_type_to_source_type(ev.evidence_type),
+                source_version=ev.code_commit_hash,
+            )
+
+            sync_result = await upsert_evidence(
+                client,
+                system_id=self._system_id,
+                name=ev.name,
+                description=ev.description,
+                evidence_type=ev.evidence_type,
+                source="cli",
+                control_id=ev.control_id,
+                framework_id=ev.framework_id,
+                code_context=code_context or None,
+                audit_metadata=audit,
+            )
+            platform_id = sync_result.evidence_id
+
+            if platform_id:
+                if ev.path:
+                    # Update local file with platform_id, off the event loop so
+                    # other in-flight upserts keep progressing.
+                    ev.platform_id = platform_id
+                    await asyncio.to_thread(self._update_frontmatter, ev)
+            return sync_result
+
+        except Exception as e:
+            logger.warning("Evidence sync error for %s: %s", label, e)
+            return e
+
     @staticmethod
     def _update_frontmatter(evidence: LocalEvidence) -> None:
         """Rewrite a file's frontmatter with updated platform_id."""
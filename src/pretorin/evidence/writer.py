@@ -8,9 +8,12 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 from pretorin.local_file import (
+    list_markdown_files,
     parse_frontmatter,
+    read_frontmatter_and_body,
     safe_path_component,
     slugify,
+    write_text_atomic,
 )
 
 # Backward-compatible aliases for existing callers/tests.
@@ -75,11 +78,23 @@ def _format_frontmatter(evidence: LocalEvidence) -> str:
     return "\n".join(lines)
 
 
+def _has_platform_id(fm: dict[str, str]) -> bool:
+    """Return whether the frontmatter carries a platform ID (already pushed)."""
+    return bool(fm.get("platform_id"))
+
+
+def _is_title_line(line: str) -> bool:
+    """Return whether a body line is a top-level heading."""
+    return line.startswith("# ")
+
+
 class EvidenceWriter:
     """Writes and reads local evidence markdown files."""
 
     def __init__(self, base_dir: Path | None = None) -> None:
         self.base_dir = base_dir or Path.cwd() / "evidence"
+        # Directories already created by this writer; skips repeat mkdir calls.
+        self._ready_dirs: set[Path] = set()
 
     def write(self, evidence: LocalEvidence) -> Path:
         """Write an evidence item to a markdown file.
@@ -93,7 +108,9 @@ class EvidenceWriter:
         safe_framework = _safe_path_component(evidence.framework_id)
         safe_control = _safe_path_component(evidence.control_id)
         dir_path = self.base_dir / safe_framework / safe_control
-        dir_path.mkdir(parents=True, exist_ok=True)
+        if dir_path not in self._ready_dirs:
+            dir_path.mkdir(parents=True, exist_ok=True)
+            self._ready_dirs.add(dir_path)
 
         file_path = dir_path / f"{slug}.md"
         # Final check: resolved path must be under base_dir
@@ -103,39 +120,41 @@ class EvidenceWriter:
         frontmatter = _format_frontmatter(evidence)
         content = f"{frontmatter}\n\n# {evidence.name}\n\n{evidence.description}\n"
 
-        file_path.write_text(content)
+        try:
+            write_text_atomic(file_path, content)
+        except FileNotFoundError:
+            # The directory was removed after this writer created it.
+            dir_path.mkdir(parents=True, exist_ok=True)
+            write_text_atomic(file_path, content)
         evidence.path = file_path
         return file_path
 
-    def read(self, path: Path) -> LocalEvidence:
+    def read(self, path: Path, *, skip_synced_description: bool = False) -> LocalEvidence:
         """Parse an evidence markdown file back to a LocalEvidence model.
 
         Args:
             path: Path to the evidence markdown file.
+            skip_synced_description: When True, a file that already carries a
+                ``platform_id`` is read only through its title heading and
+                ``description`` is left empty. The file is opened only once.
 
         Returns:
             LocalEvidence parsed from the file.
         """
-        content = path.read_text()
-        fm, body = _parse_frontmatter(content)
+        skip_body = _has_platform_id if skip_synced_description else None
+        fm, body = read_frontmatter_and_body(path, skip_body=skip_body, head_until=_is_title_line)
+        skipped = skip_body is not None and skip_body(fm)
 
-        # Extract name from first heading
+        # Name is the first heading; description is everything after it.
+        lines = body.split("\n")
         name = ""
-        for line in body.split("\n"):
+        desc_start = len(lines)
+        for i, line in enumerate(lines):
             if line.startswith("# "):
                 name = line[2:].strip()
+                desc_start = i + 1
                 break
-
-        # Extract description (everything after the first heading)
-        desc_lines = []
-        found_heading = False
-        for line in body.split("\n"):
-            if line.startswith("# ") and not found_heading:
-                found_heading = True
-                continue
-            if found_heading:
-                desc_lines.append(line)
-        description = "\n".join(desc_lines).strip()
+        description = "" if skipped else "\n".join(lines[desc_start:]).strip()
 
         # Issue #79: legacy on-disk files may be missing `evidence_type`, and
         # previous versions of the CLI silently defaulted to the non-canonical
@@ -167,11 +186,14 @@ class EvidenceWriter:
             code_commit_hash=fm.get("code_commit_hash"),
         )
 
-    def list_local(self, framework_id: str | None = None) -> list[LocalEvidence]:
+    def list_local(self, framework_id: str | None = None, *, skip_synced_bodies: bool = False) -> list[LocalEvidence]:
         """List all local evidence files.
 
         Args:
             framework_id: Optional filter by framework.
+            skip_synced_bodies: When True, files that already carry a
+                ``platform_id`` are read only through their title heading and
+                come back with an empty ``description``.
 
         Returns:
             List of LocalEvidence items.
@@ -185,9 +207,9 @@ class EvidenceWriter:
         if not search_dir.exists():
             return []
 
-        for md_file in sorted(search_dir.rglob("*.md")):
+        for md_file in list_markdown_files(search_dir):
             try:
-                results.append(self.read(md_file))
+                results.append(self.read(md_file, skip_synced_description=skip_synced_bodies))
             except Exception:
                 continue
 
@@ -8,14 +8,22 @@ those operations — the per-domain modules import from here.
 
 from __future__ import annotations
 
+import os
 import re
+import stat
+from collections.abc import Callable
 from pathlib import Path
 
+_DOTS_RE = re.compile(r"\.{2,}")
+_NON_WORD_RE = re.compile(r"[^\w\s-]")
+_WHITESPACE_RE = re.compile(r"[\s_]+")
+_DASHES_RE = re.compile(r"-+")
+
 
 def safe_path_component(text: str) -> str:
     """Sanitize a string for use as a path component (no traversal)."""
     cleaned = text.replace("/", "").replace("\\", "").replace("\0", "")
-    cleaned = re.sub(r"\.{2,}", ".", cleaned)
+    cleaned = _DOTS_RE.sub(".", cleaned)
     cleaned = cleaned.strip(". ")
     if not cleaned:
         raise ValueError(f"Invalid path component: {text!r}")
@@ -25,46 +33,145 @@ def safe_path_component(text: str) -> str:
 def slugify(text: str) -> str:
     """Convert text to a filesystem-safe slug."""
     slug = text.lower().strip()
-    slug = re.sub(r"[^\w\s-]", "", slug)
-    slug = re.sub(r"[\s_]+", "-", slug)
-    slug = re.sub(r"-+", "-", slug)
+    slug = _NON_WORD_RE.sub("", slug)
+    slug = _WHITESPACE_RE.sub("-", slug)
+    slug = _DASHES_RE.sub("-", slug)
     return slug[:80].rstrip("-")
 
 
+def list_markdown_files(root: Path) -> list[Path]:
+    """Return every ``*.md`` file under ``root``, sorted like ``sorted(root.rglob("*.md"))``.
+
+    Walks with ``os.scandir`` so directory entries are classified from the
+    type returned by the directory listing instead of a stat per path.
+    Symlinked directories are not descended into, matching ``rglob``.
+    """
+    found: list[Path] = []
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".md"):
+                        found.append(Path(entry.path))
+        except OSError:
+            continue
+    found.sort()
+    return found
+
+
 def parse_frontmatter(content: str) -> tuple[dict[str, str], str]:
     """Parse YAML frontmatter from a markdown file.
 
     Returns:
         Tuple of (frontmatter dict, body text).
     """
-    if not content.startswith("---"):
+    end = _closing_fence(content)
+    if end < 0:
         return {}, content
 
-    parts = content.split("---", 2)
-    if len(parts) < 3:
-        return {}, content
+    return _parse_frontmatter_text(content[3:end]), content[end + 3 :].strip()
+
 
-    fm_text = parts[1].strip()
-    body = parts[2].strip()
+def _closing_fence(content: str) -> int:
+    """Return the offset of the closing ``---`` fence, or -1 if there is none.
 
+    Only the frontmatter is scanned, instead of splitting the whole body.
+    """
+    if not content.startswith("---"):
+        return -1
+    return content.find("---", 3)
+
+
+def read_frontmatter_and_body(
+    path: Path,
+    *,
+    skip_body: Callable[[dict[str, str]], bool] | None = None,
+    head_until: Callable[[str], bool] | None = None,
+) -> tuple[dict[str, str], str]:
+    """Read a markdown file's frontmatter and then its body from the same handle.
+
+    Returns the same pair as ``parse_frontmatter(path.read_text())``. When
+    ``skip_body`` accepts the parsed frontmatter, the rest of the file is not
+    read: the body is empty, or with ``head_until`` runs only through the
+    first body line it accepts. Files without frontmatter are read whole.
+    """
+    with path.open() as f:
+        first = f.readline()
+        if not first.startswith("---"):
+            return {}, first + f.read()
+        fm_lines: list[str] = []
+        line = first[3:]
+        while (end := line.find("---")) < 0:
+            fm_lines.append(line)
+            line = f.readline()
+            if not line:
+                return {}, first + "".join(fm_lines[1:])
+        fm_lines.append(line[:end])
+        fm = _parse_frontmatter_text("".join(fm_lines))
+
+        rest = line[end + 3 :]
+        if skip_body is None or not skip_body(fm):
+            return fm, (rest + f.read()).strip()
+        if head_until is None:
+            return fm, ""
+        head = [rest]
+        while not head_until(rest):
+            rest = f.readline()
+            if not rest:
+                break
+            head.append(rest)
+        return fm, "".join(head).strip()
+
+
+def _parse_frontmatter_text(fm_text: str) -> dict[str, str]:
+    """Parse ``key: value`` lines between the frontmatter fences."""
     fm: dict[str, str] = {}
-    for line in fm_text.split("\n"):
+    for line in fm_text.strip().split("\n"):
         if ":" in line:
             key, _, value = line.partition(":")
             fm[key.strip()] = value.strip()
+    return fm
 
-    return fm, body
+
+def write_text_atomic(path: Path, content: str) -> None:
+    """Write ``content`` to ``path`` through a sibling temp file and ``os.replace``.
+
+    Readers never see a half-written file, and an interrupted write leaves
+    the previous version intact.  A symlinked ``path`` is followed, so the
+    link survives and its target is replaced, and an existing file keeps
+    its permission bits.
+    """
+    target = path.resolve()
+    try:
+        mode: int | None = stat.S_IMODE(os.stat(target).st_mode)
+    except FileNotFoundError:
+        mode = None
+    tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(content)
+        if mode is not None:
+            os.chmod(tmp, mode)
+        os.replace(tmp, target)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 def update_file_frontmatter(path: Path, new_frontmatter: str) -> None:
     """Rewrite a file's YAML frontmatter in-place, preserving the body."""
-    if not path.exists():
+    try:
+        content = path.read_text()
+    except FileNotFoundError:
         return
 
-    content = path.read_text()
-
-    if content.startswith("---"):
-        parts = content.split("---", 2)
-        if len(parts) >= 3:
-            body = parts[2]
-            path.write_text(f"{new_frontmatter}\n{body}")
+    end = _closing_fence(content)
+    if end >= 0:
+        # The body keeps its own separator after the closing fence, so a
+        # rewrite with unchanged frontmatter reproduces the file exactly.
+        body = content[end + 3 :]
+        updated = f"{new_frontmatter}{body}" if body.startswith("\n") else f"{new_frontmatter}\n{body}"
+        if updated != content:
+            path.write_text(updated)
@@ -17,6 +17,14 @@ logger = logging.getLogger(__name__)
 # Alias for backward compatibility within this module.
 _safe_args = safe_args
 
+NO_SYSTEMS_NOTE = (
+    "No systems found. Systems can only be created on the Pretorin platform "
+    "(https://platform.pretorin.com) with a beta code. Pretorin is currently "
+    "in closed beta — the user can sign up for early access at "
+    "https://pretorin.com/early-access/. Without a system, framework and "
+    "control browsing tools still work."
+)
+
 
 async def handle_list_systems(
     client: PretorianClient,
@@ -38,13 +46,7 @@ async def handle_list_systems(
         ],
     }
     if not systems:
-        result["note"] = (
-            "No systems found. Systems can only be created on the Pretorin platform "
-            "(https://platform.pretorin.com) with a beta code. Pretorin is currently "
-            "in closed beta — the user can sign up for early access at "
-            "https://pretorin.com/early-access/. Without a system, framework and "
-            "control browsing tools still work."
-        )
+        result["note"] = NO_SYSTEMS_NOTE
     return format_json(result)
 
 
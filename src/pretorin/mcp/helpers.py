@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import logging
+from functools import cache
 from typing import Any
 
 from mcp.types import CallToolResult, TextContent
@@ -13,6 +14,7 @@ from pretorin.client import PretorianClient
 from pretorin.client.api import PretorianClientError
 from pretorin.evidence.types import VALID_EVIDENCE_TYPES as VALID_EVIDENCE_TYPES
 from pretorin.scope import ExecutionScope
+from pretorin.utils import VALID_CONTROL_STATUSES as VALID_CONTROL_STATUSES
 from pretorin.utils import normalize_control_id
 from pretorin.workflows.compliance_updates import resolve_system
 
@@ -24,19 +26,11 @@ logger = logging.getLogger(__name__)
 
 # VALID_EVIDENCE_TYPES is re-exported from pretorin.evidence.types (issue #79).
 # Kept here for backward compatibility with existing imports; new code should
-# import from pretorin.evidence.types directly.
-VALID_SEVERITIES = {"critical", "high", "medium", "low", "info"}
-VALID_EVENT_TYPES = {"security_scan", "configuration_change", "access_review", "compliance_check"}
-VALID_CONTROL_STATUSES = {
-    "implemented",
-    "partially_implemented",
-    "planned",
-    "in_progress",
-    "ready_to_approve",
-    "not_started",
-    "not_applicable",
-    "inherited",
-}
+# import from pretorin.evidence.types directly. VALID_CONTROL_STATUSES is
+# likewise re-exported from pretorin.utils so the CLI can validate statuses
+# without importing the MCP SDK.
+VALID_SEVERITIES = frozenset({"critical", "high", "medium", "low", "info"})
+VALID_EVENT_TYPES = frozenset({"security_scan", "configuration_change", "access_review", "compliance_check"})
 
 _CONTROL_ID_DESCRIPTION = (
     "The control ID. Use canonical IDs from list_controls. "
@@ -51,9 +45,27 @@ _CONTROL_ID_EXAMPLES = ["ac-02", "sc-07", "AC.L2-3.1.1", "03.01.01"]
 # ---------------------------------------------------------------------------
 
 
-def safe_args(arguments: dict[str, Any]) -> dict[str, Any]:
-    """Return arguments with sensitive fields redacted for logging."""
-    return {k: ("***" if k == "api_key" else v) for k, v in arguments.items()}
+class _RedactedArgs:
+    """Tool arguments that are redacted only when a log record is formatted."""
+
+    __slots__ = ("_arguments",)
+
+    def __init__(self, arguments: dict[str, Any]) -> None:
+        self._arguments = arguments
+
+    def __str__(self) -> str:
+        return str({k: ("***" if k == "api_key" else v) for k, v in self._arguments.items()})
+
+    __repr__ = __str__
+
+
+def safe_args(arguments: dict[str, Any]) -> _RedactedArgs:
+    """Return arguments with sensitive fields redacted for logging.
+
+    Handlers log this at DEBUG on every call, so the redacted copy is built
+    lazily and skipped entirely when DEBUG is disabled.
+    """
+    return _RedactedArgs(arguments)
 
 
 # ---------------------------------------------------------------------------
@@ -80,6 +92,15 @@ def system_id_property(*, optional: bool = False) -> dict[str, Any]:
     }
 
 
+def framework_id_property(*, optional: bool = False) -> dict[str, Any]:
+    """Return a shared JSON schema field for framework_id parameters."""
+    description = "Framework ID" if not optional else "Optional: Framework ID; defaults to active scope"
+    return {
+        "type": "string",
+        "description": description,
+    }
+
+
 def allow_scope_override_property() -> dict[str, Any]:
     """Return a shared JSON schema field for explicit scope overrides."""
     return {
@@ -128,19 +149,26 @@ def require(arguments: dict[str, Any], *keys: str) -> str | None:
 
     Returns an error message string if validation fails, None if all ok.
     """
-    missing = [k for k in keys if not arguments.get(k)]
+    get = arguments.get
+    missing = [k for k in keys if not get(k)]
     if missing:
         return f"Missing required parameter(s): {', '.join(missing)}"
     return None
 
 
-def validate_enum(value: str, valid: set[str], field_name: str) -> str | None:
+@cache
+def _enum_choices(valid: frozenset[str]) -> str:
+    """Return the sorted, comma-joined choices for an enum set (built once per set)."""
+    return ", ".join(sorted(valid))
+
+
+def validate_enum(value: str, valid: frozenset[str], field_name: str) -> str | None:
     """Validate a value against allowed enum values.
 
     Returns an error message if invalid, None if ok.
     """
     if value not in valid:
-        return f"Invalid {field_name}: {value!r}. Must be one of: {', '.join(sorted(valid))}"
+        return f"Invalid {field_name}: {value!r}. Must be one of: {_enum_choices(valid)}"
     return None
 
 
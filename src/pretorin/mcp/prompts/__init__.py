@@ -10,8 +10,13 @@ This package contains the analysis guidance for the 5 core controls used in demo
 
 from __future__ import annotations
 
-from pretorin.mcp.prompts.control_prompts import CONTROL_ANALYSIS_PROMPTS
-from pretorin.mcp.prompts.framework_guides import FRAMEWORK_GUIDES
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any
+
+from pretorin.mcp.prompts import control_prompts, framework_guides
+from pretorin.mcp.prompts.control_prompts import CONTROL_PROMPT_IDS, load_control_prompt
+from pretorin.mcp.prompts.framework_guides import FRAMEWORK_GUIDE_IDS, load_framework_guide
 from pretorin.mcp.prompts.schema import ARTIFACT_SCHEMA, ARTIFACT_SCHEMA_TEXT
 
 
@@ -20,37 +25,49 @@ def get_artifact_schema() -> str:
     return ARTIFACT_SCHEMA_TEXT
 
 
+@lru_cache(maxsize=64)
 def get_framework_guide(framework_id: str) -> str | None:
-    """Return the analysis guide for a framework."""
+    """Return the analysis guide for a framework.
+
+    Memoized: MCP hosts ask for the same few framework IDs repeatedly, and
+    partial matches otherwise rescan every guide ID.
+    """
     # Normalize framework ID and check for matches
     framework_id_lower = framework_id.lower()
 
     # Direct match
-    if framework_id_lower in FRAMEWORK_GUIDES:
-        return FRAMEWORK_GUIDES[framework_id_lower]
+    if framework_id_lower in FRAMEWORK_GUIDE_IDS:
+        return load_framework_guide(framework_id_lower)
 
     # Partial matches
-    for key, guide in FRAMEWORK_GUIDES.items():
+    for key in FRAMEWORK_GUIDE_IDS:
         if key in framework_id_lower or framework_id_lower in key:
-            return guide
+            return load_framework_guide(key)
 
     return None
 
 
-def get_control_prompt(control_id: str) -> dict[str, str] | None:
-    """Return the analysis prompt for a control."""
+def get_control_prompt(control_id: str) -> Mapping[str, str] | None:
+    """Return the read-only analysis prompt for a control."""
     from pretorin.utils import normalize_control_id
 
     normalized = normalize_control_id(control_id)
-    # Try normalized form first, then fall back to un-padded for legacy keys
-    result = CONTROL_ANALYSIS_PROMPTS.get(normalized)
-    if result is None:
-        result = CONTROL_ANALYSIS_PROMPTS.get(control_id.lower())
-    return result
+    if normalized in CONTROL_PROMPT_IDS:
+        return load_control_prompt(normalized)
+    # Fall back to un-padded for legacy keys; only lowercase on a miss
+    legacy = control_id.lower()
+    if legacy in CONTROL_PROMPT_IDS:
+        return load_control_prompt(legacy)
+    return None
 
 
+@lru_cache(maxsize=128)
 def format_control_analysis_prompt(framework_id: str, control_id: str) -> str:
-    """Format a complete analysis prompt for a control."""
+    """Format a complete analysis prompt for a control.
+
+    Memoized: the output depends only on the two IDs, and hosts re-request
+    the same control resources throughout a session.
+    """
     from pretorin.utils import normalize_control_id
 
     normalized_control_id = normalize_control_id(control_id)
@@ -98,9 +115,10 @@ Set the framework_id to `{framework_id}` and control_id to `{normalized_control_
 
 def get_available_controls() -> list[str]:
     """Return list of controls with analysis prompts."""
-    return list(CONTROL_ANALYSIS_PROMPTS.keys())
+    return list(CONTROL_PROMPT_IDS)
 
 
+@lru_cache(maxsize=128)
 def get_control_summary(control_id: str) -> str | None:
     """Return a brief summary for a control."""
     prompt_data = get_control_prompt(control_id)
@@ -109,6 +127,15 @@ def get_control_summary(control_id: str) -> str | None:
     return None
 
 
+def __getattr__(name: str) -> Any:
+    # The full prompt/guide tables are only built if a caller asks for them.
+    if name == "CONTROL_ANALYSIS_PROMPTS":
+        return control_prompts.CONTROL_ANALYSIS_PROMPTS
+    if name == "FRAMEWORK_GUIDES":
+        return framework_guides.FRAMEWORK_GUIDES
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "ARTIFACT_SCHEMA",
     "ARTIFACT_SCHEMA_TEXT",
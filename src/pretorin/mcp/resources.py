@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from urllib.parse import urlparse
+from collections.abc import Callable
+from functools import cache
+from urllib.parse import urlsplit
 
 from mcp.types import Resource
 
@@ -29,6 +31,16 @@ _FRAMEWORK_GUIDES = [
 
 async def list_resources() -> list[Resource]:
     """List available MCP resources for compliance analysis."""
+    return list(_static_resources())
+
+
+@cache
+def _static_resources() -> tuple[Resource, ...]:
+    """Build the resource catalog once.
+
+    Every entry comes from bundled guides, control prompts, and workflow
+    recipes, none of which change while the server runs.
+    """
     resources = [
         Resource(
             uri="analysis://schema",
@@ -77,12 +89,12 @@ async def list_resources() -> list[Resource]:
             )
         )
 
-    return resources
+    return tuple(resources)
 
 
 async def read_resource(uri: str) -> str:
     """Read an analysis resource."""
-    parsed = urlparse(uri)
+    parsed = urlsplit(uri)
 
     if parsed.scheme == "status":
         if parsed.netloc != "cli":
@@ -127,27 +139,42 @@ async def read_resource(uri: str) -> str:
     resource_type = parsed.netloc
     path_parts = [p for p in parsed.path.split("/") if p]
 
-    if resource_type == "schema":
-        return get_artifact_schema()
-
-    elif resource_type == "guide":
-        if not path_parts:
-            raise ValueError("Framework ID required for guide resource")
-        framework_id = path_parts[0]
-        guide = get_framework_guide(framework_id)
-        if guide:
-            return guide
-        raise ValueError(f"No analysis guide available for framework: {framework_id}")
-
-    elif resource_type == "control":
-        if not path_parts:
-            raise ValueError("Control ID required for control resource")
-        if len(path_parts) != 2:
-            raise ValueError("Control resources require framework_id and control_id")
-        framework_id = path_parts[0]
-        control_id = normalize_control_id(path_parts[1])
-
-        return format_control_analysis_prompt(framework_id, control_id)
-
-    else:
+    handler = _ANALYSIS_HANDLERS.get(resource_type)
+    if handler is None:
         raise ValueError(f"Unknown resource type: {resource_type}")
+    return handler(path_parts)
+
+
+def _read_schema(path_parts: list[str]) -> str:
+    """Read ``analysis://schema``."""
+    return get_artifact_schema()
+
+
+def _read_guide(path_parts: list[str]) -> str:
+    """Read ``analysis://guide/<framework_id>``."""
+    if not path_parts:
+        raise ValueError("Framework ID required for guide resource")
+    framework_id = path_parts[0]
+    guide = get_framework_guide(framework_id)
+    if guide:
+        return guide
+    raise ValueError(f"No analysis guide available for framework: {framework_id}")
+
+
+def _read_control(path_parts: list[str]) -> str:
+    """Read ``analysis://control/<framework_id>/<control_id>``."""
+    if not path_parts:
+        raise ValueError("Control ID required for control resource")
+    if len(path_parts) != 2:
+        raise ValueError("Control resources require framework_id and control_id")
+    framework_id = path_parts[0]
+    control_id = normalize_control_id(path_parts[1])
+
+    return format_control_analysis_prompt(framework_id, control_id)
+
+
+_ANALYSIS_HANDLERS: dict[str, Callable[[list[str]], str]] = {
+    "schema": _read_schema,
+    "guide": _read_guide,
+    "control": _read_control,
+}
@@ -12,8 +12,13 @@ from mcp.server.stdio import stdio_server
 from mcp.types import CallToolResult, Resource, TextContent, Tool
 
 from pretorin.cli.version_check import get_update_status
-from pretorin.client import PretorianClient
-from pretorin.client.api import AuthenticationError, NotFoundError, PretorianClientError
+from pretorin.client.api import (
+    AuthenticationError,
+    NotFoundError,
+    PretorianClientError,
+    close_shared_client,
+    get_shared_client,
+)
 from pretorin.mcp.handlers import TOOL_HANDLERS
 from pretorin.mcp.helpers import format_error
 from pretorin.mcp.resources import list_resources as _list_resources
@@ -86,24 +91,32 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent] |
             logger.warning("Unknown tool requested: %s", name)
             return format_error(f"Unknown tool: {name}")
 
-        async with PretorianClient() as client:
-            if not client.is_configured:
-                logger.warning("Tool call %s failed: client not authenticated", name)
-                return format_error("Not authenticated. Please run 'pretorin login' in the terminal first.")
-
-            if handler:
-                return await handler(client, arguments)
-            # Phase C: per-recipe-script tools (pretorin_recipe_<id>__<tool>) are
-            # not in the static TOOL_HANDLERS table — they're registered dynamically
-            # from the recipe registry. Dispatch the catch-all here when the name
-            # matches the prefix.
-            if name.startswith("pretorin_recipe_") and "__" in name[len("pretorin_recipe_") :]:
-                from pretorin.mcp.handlers.recipe import handle_run_recipe_script
-
-                return await handle_run_recipe_script(client, arguments, tool_name=name)
+        # Phase C: per-recipe-script tools (pretorin_recipe_<id>__<tool>) are
+        # not in the static TOOL_HANDLERS table — they're registered dynamically
+        # from the recipe registry. Dispatch the catch-all here when the name
+        # matches the prefix.
+        is_recipe_tool = name.startswith("pretorin_recipe_") and "__" in name[len("pretorin_recipe_") :]
+        # Reject unknown names before touching config or the client.
+        if handler is None and not is_recipe_tool:
             logger.warning("Unknown tool requested: %s", name)
             return format_error(f"Unknown tool: {name}")
 
+        # One client per server process keeps the connection pool warm
+        # across tool calls; it is closed when the server shuts down.  The
+        # config is re-checked on every call, so a login while the server
+        # runs takes effect on the next call.
+        client = get_shared_client()
+        if not client.is_configured:
+            logger.warning("Tool call %s failed: client not authenticated", name)
+            return format_error("Not authenticated. Please run 'pretorin login' in the terminal first.")
+
+        if handler:
+            return await handler(client, arguments)
+
+        from pretorin.mcp.handlers.recipe import handle_run_recipe_script
+
+        return await handle_run_recipe_script(client, arguments, tool_name=name)
+
     except AuthenticationError as e:
         logger.warning("Authentication error during tool %s: %s", name, e.message)
         return format_error(f"Authentication failed: {e.message}")
@@ -120,12 +133,15 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent] |
 
 async def _run_server() -> None:
     """Run the MCP server."""
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options(),
-        )
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options(),
+            )
+    finally:
+        await close_shared_client()
 
 
 def _maybe_print_startup_update_notice() -> None:
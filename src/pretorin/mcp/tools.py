@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cache
 from typing import Any
 
 from mcp.types import Tool
@@ -14,6 +15,7 @@ from pretorin.mcp.helpers import (
     allow_scope_override_property,
     allow_unverified_sources_property,
     control_id_property,
+    framework_id_property,
     system_id_property,
 )
 
@@ -26,14 +28,17 @@ async def list_tools() -> list[Tool]:
     recipe contributes one MCP tool named ``pretorin_recipe_<safe_id>__<tool>``
     with ``inputSchema`` derived from the script's ``ScriptDecl.params``.
     """
-    static_tools = _static_tools()
-    dynamic_tools = _recipe_script_tools()
-    return static_tools + dynamic_tools
+    return [*_static_tools(), *_recipe_script_tools()]
 
 
-def _static_tools() -> list[Tool]:
-    """Return the always-present built-in MCP tools."""
-    return [
+@cache
+def _static_tools() -> tuple[Tool, ...]:
+    """Return the always-present built-in MCP tools.
+
+    The catalog depends only on module constants, so it is built once per
+    process; recipe tools stay dynamic because the registry can change.
+    """
+    return (
         # === Framework / Control Reference Tools ===
         Tool(
             name="pretorin_list_frameworks",
@@ -240,10 +245,7 @@ def _static_tools() -> list[Tool]:
                 "properties": {
                     "system_id": system_id_property(optional=True),
                     "control_id": control_id_property(optional=True),
-                    "framework_id": {
-                        "type": "string",
-                        "description": "Optional: Framework ID; defaults to active scope",
-                    },
+                    "framework_id": framework_id_property(optional=True),
                     "limit": {
                         "type": "integer",
                         "description": "Maximum number of results (default 20)",
@@ -331,10 +333,7 @@ def _static_tools() -> list[Tool]:
                 "type": "object",
                 "properties": {
                     "system_id": system_id_property(optional=True),
-                    "framework_id": {
-                        "type": "string",
-                        "description": "Optional: Framework ID; defaults to active scope",
-                    },
+                    "framework_id": framework_id_property(optional=True),
                     "items": {
                         "type": "array",
                         "description": "Scoped evidence items to create and link",
@@ -427,10 +426,7 @@ def _static_tools() -> list[Tool]:
                         "description": "Evidence description",
                     },
                     "control_id": control_id_property(optional=True),
-                    "framework_id": {
-                        "type": "string",
-                        "description": "Optional: Framework ID; defaults to active scope",
-                    },
+                    "framework_id": framework_id_property(optional=True),
                     "allow_scope_override": allow_scope_override_property(),
                     "allow_unverified_sources": allow_unverified_sources_property(),
                 },
@@ -448,10 +444,7 @@ def _static_tools() -> list[Tool]:
                         "type": "string",
                         "description": "The evidence item ID to delete",
                     },
-                    "framework_id": {
-                        "type": "string",
-                        "description": "Optional: Framework ID; defaults to active scope",
-                    },
+                    "framework_id": framework_id_property(optional=True),
                     "allow_scope_override": allow_scope_override_property(),
                 },
                 "required": ["evidence_id"],
@@ -466,10 +459,7 @@ def _static_tools() -> list[Tool]:
                 "properties": {
                     "system_id": system_id_property(optional=True),
                     "control_id": control_id_property(),
-                    "framework_id": {
-                        "type": "string",
-                        "description": "Optional: Framework ID; defaults to active scope",
-                    },
+                    "framework_id": framework_id_property(optional=True),
                     "allow_scope_override": allow_scope_override_property(),
                     "allow_unverified_sources": allow_unverified_sources_property(),
                 },
@@ -511,10 +501,7 @@ def _static_tools() -> list[Tool]:
                 "type": "object",
                 "properties": {
                     "system_id": system_id_property(optional=True),
-                    "framework_id": {
-                        "type": "string",
-                        "description": "Optional: Framework ID; defaults to active scope",
-                    },
+                    "framework_id": framework_id_property(optional=True),
                     "title": {
                         "type": "string",
                         "description": "Event title",
@@ -554,10 +541,7 @@ def _static_tools() -> list[Tool]:
                 "properties": {
                     "system_id": system_id_property(optional=True),
                     "control_id": control_id_property(),
-                    "framework_id": {
-                        "type": "string",
-                        "description": "Optional: Framework ID; defaults to active scope",
-                    },
+                    "framework_id": framework_id_property(optional=True),
                 },
                 "required": ["control_id"],
             },
@@ -692,10 +676,7 @@ def _static_tools() -> list[Tool]:
                 "properties": {
                     "system_id": system_id_property(optional=True),
                     "control_id": control_id_property(),
-                    "framework_id": {
-                        "type": "string",
-                        "description": "Optional: Framework ID; defaults to active scope",
-                    },
+                    "framework_id": framework_id_property(optional=True),
                     "narrative": {
                         "type": "string",
                         "description": (
@@ -726,10 +707,7 @@ def _static_tools() -> list[Tool]:
                 "properties": {
                     "system_id": system_id_property(optional=True),
                     "control_id": control_id_property(),
-                    "framework_id": {
-                        "type": "string",
-                        "description": "Optional: Framework ID; defaults to active scope",
-                    },
+                    "framework_id": framework_id_property(optional=True),
                     "content": {
                         "type": "string",
                         "description": "Note content (suggestions, manual steps, integration guidance)",
@@ -755,10 +733,7 @@ def _static_tools() -> list[Tool]:
                         "type": "string",
                         "description": "ID of the note to resolve or update",
                     },
-                    "framework_id": {
-                        "type": "string",
-                        "description": "Optional: Framework ID; defaults to active scope",
-                    },
+                    "framework_id": framework_id_property(optional=True),
                     "is_resolved": {
                         "type": "boolean",
                         "description": "Whether to mark the note resolved (true) or reopen it (false)",
@@ -786,10 +761,7 @@ def _static_tools() -> list[Tool]:
                 "properties": {
                     "system_id": system_id_property(optional=True),
                     "control_id": control_id_property(),
-                    "framework_id": {
-                        "type": "string",
-                        "description": "Optional: Framework ID; defaults to active scope",
-                    },
+                    "framework_id": framework_id_property(optional=True),
                 },
                 "required": ["control_id"],
             },
@@ -810,10 +782,7 @@ def _static_tools() -> list[Tool]:
                         "description": "New implementation status",
                         "enum": sorted(VALID_CONTROL_STATUSES),
                     },
-                    "framework_id": {
-                        "type": "string",
-                        "description": "Optional: Framework ID; defaults to active scope",
-                    },
+                    "framework_id": framework_id_property(optional=True),
                     "allow_scope_override": allow_scope_override_property(),
                     "allow_unverified_sources": allow_unverified_sources_property(),
                 },
@@ -830,10 +799,7 @@ def _static_tools() -> list[Tool]:
                 "properties": {
                     "system_id": system_id_property(optional=True),
                     "control_id": control_id_property(),
-                    "framework_id": {
-                        "type": "string",
-                        "description": "Optional: Framework ID; defaults to active scope",
-                    },
+                    "framework_id": framework_id_property(optional=True),
                     "allow_scope_override": allow_scope_override_property(),
                     "allow_unverified_sources": allow_unverified_sources_property(),
                 },
@@ -873,7 +839,7 @@ def _static_tools() -> list[Tool]:
                 "type": "object",
                 "properties": {
                     "system_id": system_id_property(),
-                    "framework_id": {"type": "string", "description": "Framework ID"},
+                    "framework_id": framework_id_property(),
                 },
                 "required": ["system_id", "framework_id"],
             },
@@ -889,7 +855,7 @@ def _static_tools() -> list[Tool]:
                 "properties": {
                     "system_id": system_id_property(),
                     "question_id": {"type": "string", "description": "Question ID from the pending list"},
-                    "framework_id": {"type": "string", "description": "Framework ID"},
+                    "framework_id": framework_id_property(),
                 },
                 "required": ["system_id", "question_id", "framework_id"],
             },
@@ -927,7 +893,7 @@ def _static_tools() -> list[Tool]:
                     "system_id": system_id_property(),
                     "question_id": {"type": "string", "description": "Question ID to answer"},
                     "answer": {"type": "string", "description": "The answer text. Set to null to clear."},
-                    "framework_id": {"type": "string", "description": "Framework ID"},
+                    "framework_id": framework_id_property(),
                 },
                 "required": ["system_id", "question_id", "answer", "framework_id"],
             },
@@ -943,7 +909,7 @@ def _static_tools() -> list[Tool]:
                 "type": "object",
                 "properties": {
                     "system_id": system_id_property(),
-                    "framework_id": {"type": "string", "description": "Framework ID"},
+                    "framework_id": framework_id_property(),
                 },
                 "required": ["system_id", "framework_id"],
             },
@@ -959,7 +925,7 @@ def _static_tools() -> list[Tool]:
                 "type": "object",
                 "properties": {
                     "system_id": system_id_property(),
-                    "framework_id": {"type": "string", "description": "Framework ID"},
+                    "framework_id": framework_id_property(),
                 },
                 "required": ["system_id", "framework_id"],
             },
@@ -1125,7 +1091,7 @@ def _static_tools() -> list[Tool]:
                 "type": "object",
                 "properties": {
                     "system_id": system_id_property(),
-                    "framework_id": {"type": "string", "description": "Framework ID"},
+                    "framework_id": framework_id_property(),
                 },
                 "required": ["system_id", "framework_id"],
             },
@@ -1149,7 +1115,7 @@ def _static_tools() -> list[Tool]:
                             "`pretorin_list_control_families` to list valid values."
                         ),
                     },
-                    "framework_id": {"type": "string", "description": "Framework ID"},
+                    "framework_id": framework_id_property(),
                 },
                 "required": ["system_id", "family_id", "framework_id"],
             },
@@ -1173,7 +1139,7 @@ def _static_tools() -> list[Tool]:
                             "Use `pretorin_list_control_families` to list valid values."
                         ),
                     },
-                    "framework_id": {"type": "string", "description": "Framework ID"},
+                    "framework_id": framework_id_property(),
                 },
                 "required": ["system_id", "family_id", "framework_id"],
             },
@@ -1204,7 +1170,7 @@ def _static_tools() -> list[Tool]:
                 "type": "object",
                 "properties": {
                     "system_id": system_id_property(),
-                    "framework_id": {"type": "string", "description": "Framework ID"},
+                    "framework_id": framework_id_property(),
                 },
                 "required": ["system_id", "framework_id"],
             },
@@ -1219,7 +1185,7 @@ def _static_tools() -> list[Tool]:
                 "type": "object",
                 "properties": {
                     "system_id": system_id_property(),
-                    "framework_id": {"type": "string", "description": "Framework ID"},
+                    "framework_id": framework_id_property(),
                 },
                 "required": ["system_id", "framework_id"],
             },
@@ -1532,10 +1498,7 @@ def _static_tools() -> list[Tool]:
                 "properties": {
                     "system_id": system_id_property(),
                     "control_id": control_id_property(),
-                    "framework_id": {
-                        "type": "string",
-                        "description": "Framework ID",
-                    },
+                    "framework_id": framework_id_property(),
                 },
                 "required": ["system_id", "control_id", "framework_id"],
             },
@@ -1552,10 +1515,7 @@ def _static_tools() -> list[Tool]:
                 "properties": {
                     "system_id": system_id_property(),
                     "control_id": control_id_property(),
-                    "framework_id": {
-                        "type": "string",
-                        "description": "Framework ID",
-                    },
+                    "framework_id": framework_id_property(),
                     "responsibility_mode": {
                         "type": "string",
                         "enum": ["inherited", "shared"],
@@ -1582,10 +1542,7 @@ def _static_tools() -> list[Tool]:
                 "properties": {
                     "system_id": system_id_property(),
                     "control_id": control_id_property(),
-                    "framework_id": {
-                        "type": "string",
-                        "description": "Framework ID",
-                    },
+                    "framework_id": framework_id_property(),
                 },
                 "required": ["system_id", "control_id", "framework_id"],
             },
@@ -1626,10 +1583,7 @@ def _static_tools() -> list[Tool]:
                 "properties": {
                     "system_id": system_id_property(),
                     "control_id": control_id_property(),
-                    "framework_id": {
-                        "type": "string",
-                        "description": "Framework ID",
-                    },
+                    "framework_id": framework_id_property(),
                 },
                 "required": ["system_id", "control_id", "framework_id"],
             },
@@ -2098,7 +2052,7 @@ def _static_tools() -> list[Tool]:
                 "required": ["entities"],
             },
         ),
-    ]
+    )
 
 
 def _recipe_script_tools() -> list[Tool]:
@@ -33,10 +33,9 @@ class NarrativeSync:
         if system_id:
             self._system_id = system_id
         else:
-            from pretorin.client.config import Config
+            from pretorin.client.config import get_config
 
-            config = Config()
-            self._system_id = config.active_system_id or ""
+            self._system_id = get_config().active_system_id or ""
         if not self._system_id:
             raise ValueError("No active system set. Run: pretorin context set --system <id>")
         self.writer = NarrativeWriter(narrative_dir)
@@ -59,7 +58,8 @@ class NarrativeSync:
             SyncResult with counts of pushed/skipped/errored items.
         """
         result = SyncResult()
-        narratives = self.writer.list_local()
+        # Already-synced files only contribute a label, so skip their bodies.
+        narratives = self.writer.list_local(skip_synced_bodies=True)
         logger.debug("Starting narrative sync: %d local items found", len(narratives))
 
         for narr in narratives:
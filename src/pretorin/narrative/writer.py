@@ -7,7 +7,9 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 from pretorin.local_file import (
+    list_markdown_files,
     parse_frontmatter,
+    read_frontmatter_and_body,
     safe_path_component,
     slugify,
 )
@@ -19,6 +21,11 @@ _slugify = slugify
 _parse_frontmatter = parse_frontmatter
 
 
+def _is_synced(fm: dict[str, str]) -> bool:
+    """Return whether the frontmatter marks the file as pushed to the platform."""
+    return fm.get("platform_synced", "false").lower() == "true"
+
+
 @dataclass
 class LocalNarrative:
     """A locally stored narrative item."""
@@ -85,10 +92,14 @@ class NarrativeWriter:
         narrative.path = file_path
         return file_path
 
-    def read(self, path: Path) -> LocalNarrative:
-        """Parse a narrative markdown file back to a LocalNarrative model."""
-        content = path.read_text()
-        fm, body = _parse_frontmatter(content)
+    def read(self, path: Path, *, skip_synced_body: bool = False) -> LocalNarrative:
+        """Parse a narrative markdown file back to a LocalNarrative model.
+
+        With ``skip_synced_body``, files marked ``platform_synced`` are read
+        only up to their frontmatter and ``content`` is left empty; the file
+        is opened only once either way.
+        """
+        fm, body = read_frontmatter_and_body(path, skip_body=_is_synced if skip_synced_body else None)
 
         return LocalNarrative(
             control_id=fm.get("control_id", ""),
@@ -97,13 +108,18 @@ class NarrativeWriter:
             content=body,
             status=fm.get("status", "draft"),
             is_ai_generated=fm.get("is_ai_generated", "false").lower() == "true",
-            platform_synced=fm.get("platform_synced", "false").lower() == "true",
+            platform_synced=_is_synced(fm),
             created_at=fm.get("created_at", ""),
             path=path,
         )
 
-    def list_local(self, framework_id: str | None = None) -> list[LocalNarrative]:
-        """List all local narrative files."""
+    def list_local(self, framework_id: str | None = None, *, skip_synced_bodies: bool = False) -> list[LocalNarrative]:
+        """List all local narrative files.
+
+        With ``skip_synced_bodies`` set, files already marked
+        ``platform_synced`` are read only up to their frontmatter and come
+        back with empty ``content``.
+        """
         if not self.base_dir.exists():
             return []
 
@@ -113,9 +129,9 @@ class NarrativeWriter:
             return []
 
         results = []
-        for md_file in sorted(search_dir.rglob("*.md")):
+        for md_file in list_markdown_files(search_dir):
             try:
-                results.append(self.read(md_file))
+                results.append(self.read(md_file, skip_synced_body=skip_synced_bodies))
             except Exception:
                 continue
 
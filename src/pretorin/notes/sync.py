@@ -33,10 +33,9 @@ class NotesSync:
         if system_id:
             self._system_id = system_id
         else:
-            from pretorin.client.config import Config
+            from pretorin.client.config import get_config
 
-            config = Config()
-            self._system_id = config.active_system_id or ""
+            self._system_id = get_config().active_system_id or ""
         if not self._system_id:
             raise ValueError("No active system set. Run: pretorin context set --system <id>")
         self.writer = NotesWriter(notes_dir)
@@ -60,7 +59,8 @@ class NotesSync:
             SyncResult with counts of pushed/skipped/errored items.
         """
         result = SyncResult()
-        notes = self.writer.list_local()
+        # Already-synced files only contribute a label, so skip their bodies.
+        notes = self.writer.list_local(skip_synced_bodies=True)
         logger.debug("Starting notes sync: %d local items found", len(notes))
 
         for note in notes:
@@ -7,7 +7,9 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 from pretorin.local_file import (
+    list_markdown_files,
     parse_frontmatter,
+    read_frontmatter_and_body,
     safe_path_component,
     slugify,
 )
@@ -18,6 +20,11 @@ _slugify = slugify
 _parse_frontmatter = parse_frontmatter
 
 
+def _is_synced(fm: dict[str, str]) -> bool:
+    """Return whether the frontmatter marks the file as pushed to the platform."""
+    return fm.get("platform_synced", "false").lower() == "true"
+
+
 @dataclass
 class LocalNote:
     """A locally stored note item."""
@@ -81,10 +88,14 @@ class NotesWriter:
         note.path = file_path
         return file_path
 
-    def read(self, path: Path) -> LocalNote:
-        """Parse a note markdown file back to a LocalNote model."""
-        content = path.read_text()
-        fm, body = _parse_frontmatter(content)
+    def read(self, path: Path, *, skip_synced_body: bool = False) -> LocalNote:
+        """Parse a note markdown file back to a LocalNote model.
+
+        With ``skip_synced_body``, files marked ``platform_synced`` are read
+        only up to their frontmatter and ``content`` is left empty; the file
+        is opened only once either way.
+        """
+        fm, body = read_frontmatter_and_body(path, skip_body=_is_synced if skip_synced_body else None)
 
         return LocalNote(
             control_id=fm.get("control_id", ""),
@@ -92,13 +103,18 @@ class NotesWriter:
             name=path.stem,
             content=body,
             status=fm.get("status", "draft"),
-            platform_synced=fm.get("platform_synced", "false").lower() == "true",
+            platform_synced=_is_synced(fm),
             created_at=fm.get("created_at", ""),
             path=path,
         )
 
-    def list_local(self, framework_id: str | None = None) -> list[LocalNote]:
-        """List all local note files."""
+    def list_local(self, framework_id: str | None = None, *, skip_synced_bodies: bool = False) -> list[LocalNote]:
+        """List all local note files.
+
+        With ``skip_synced_bodies`` set, files already marked
+        ``platform_synced`` are read only up to their frontmatter and come
+        back with empty ``content``.
+        """
         if not self.base_dir.exists():
             return []
 
@@ -108,9 +124,9 @@ class NotesWriter:
             return []
 
         results = []
-        for md_file in sorted(search_dir.rglob("*.md")):
+        for md_file in list_markdown_files(search_dir):
             try:
-                results.append(self.read(md_file))
+                results.append(self.read(md_file, skip_synced_body=skip_synced_bodies))
             except Exception:
                 continue
 
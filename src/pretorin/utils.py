@@ -4,6 +4,22 @@ from __future__ import annotations
 
 import asyncio
 import re
+from functools import lru_cache
+
+VALID_CONTROL_STATUSES = frozenset(
+    {
+        "implemented",
+        "partially_implemented",
+        "planned",
+        "in_progress",
+        "ready_to_approve",
+        "not_started",
+        "not_applicable",
+        "inherited",
+    }
+)
+
+_NIST_CONTROL_ID_RE = re.compile(r"^([a-zA-Z]{2})-(\d+)((?:\.\d+|\(\d+\))?)$")
 
 
 async def run_command(cmd: list[str], timeout: int = 10) -> tuple[int, str, str]:
@@ -31,6 +47,7 @@ async def run_command(cmd: list[str], timeout: int = 10) -> tuple[int, str, str]
         return -1, "", f"Command not found: {cmd[0]}"
 
 
+@lru_cache(maxsize=512)
 def normalize_control_id(control_id: str) -> str:
     """Normalize a control ID to the canonical zero-padded format.
 
@@ -54,7 +71,7 @@ def normalize_control_id(control_id: str) -> str:
     # Match NIST/FedRAMP pattern: family prefix (2 letters) - number, optionally
     # followed by enhancement suffixes like .1, (1), etc.
     # e.g., ac-3, AC-02, sc-7.1 — but NOT CMMC-style IDs like AC.L1-3.1.1
-    match = re.match(r"^([a-zA-Z]{2})-(\d+)((?:\.\d+|\(\d+\))?)$", stripped)
+    match = _NIST_CONTROL_ID_RE.match(stripped)
     if not match:
         return stripped
 
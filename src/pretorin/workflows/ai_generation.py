@@ -87,7 +87,7 @@ def _dict_list(value: Any) -> list[dict[str, str]]:
 
 def _build_generation_task(system_id: str, system_name: str, framework_id: str, control_id: str) -> str:
     """Create a tightly-scoped drafting task for the Codex agent."""
-    from pretorin.mcp.helpers import VALID_EVIDENCE_TYPES
+    from pretorin.evidence.types import VALID_EVIDENCE_TYPES
 
     enum_list = "|".join(sorted(VALID_EVIDENCE_TYPES))
     return (
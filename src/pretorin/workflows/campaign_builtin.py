@@ -31,7 +31,7 @@ async def _draft_control_fix(
     working_directory: Path,
 ) -> dict[str, Any]:
     from pretorin.agent.codex_agent import CodexAgent
-    from pretorin.mcp.helpers import VALID_EVIDENCE_TYPES
+    from pretorin.evidence.types import VALID_EVIDENCE_TYPES
     from pretorin.workflows.ai_generation import _dict_list, _extract_json_object, _string_list
 
     context = await client.get_control_context(system_id, control_id, framework_id)
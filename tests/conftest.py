@@ -27,3 +27,13 @@ def pytest_collection_modifyitems(
         for item in items:
             if "integration" in item.keywords:
                 item.add_marker(skip_integration)
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_config():
+    """Give every test a fresh process-wide Config (paths and env are per-test)."""
+    from pretorin.client.config import reset_config
+
+    reset_config()
+    yield
+    reset_config()
@@ -53,6 +53,7 @@ def mock_client() -> AsyncMock:
     client.list_frameworks = AsyncMock(return_value=_ModelStub({"frameworks": []}))
     client.get_control = AsyncMock(return_value=_ModelStub({"id": "ac-02", "title": "Account Mgmt"}))
     client.get_controls_batch = AsyncMock(return_value=_ModelStub({"controls": [], "total": 0}))
+    client.get_controls_bulk = AsyncMock(return_value=[])
     client.list_evidence = AsyncMock(return_value=[])
     client.create_evidence = AsyncMock(return_value={"id": "ev-1"})
     client.create_evidence_batch = AsyncMock(return_value=_ModelStub({"results": [], "total": 0}))
@@ -391,7 +392,7 @@ class TestCreateEvidenceBatch:
         parsed = json.loads(result)
         assert "results" in parsed
         mock_client.create_evidence_batch.assert_awaited_once()
-        assert mock_client.get_control.await_count >= 2
+        mock_client.get_controls_bulk.assert_awaited_once_with("fw-1", ["ac-02", "sc-07"])
 
 
 class TestLinkEvidence:
@@ -1,5 +1,7 @@
 """Tests for analysis prompts and templates."""
 
+import pytest
+
 from pretorin.mcp.prompts import (
     CONTROL_ANALYSIS_PROMPTS,
     FRAMEWORK_GUIDES,
@@ -117,6 +119,14 @@ class TestGetControlPrompt:
         prompt_upper = get_control_prompt("AC-2")
         assert prompt_lower == prompt_upper
 
+    def test_cached_prompt_is_read_only(self):
+        """Callers cannot mutate the shared cached prompt."""
+        prompt = get_control_prompt("ac-2")
+        assert prompt is not None
+        with pytest.raises(TypeError):
+            prompt["title"] = "changed"  # type: ignore[index]
+        assert get_control_prompt("ac-2")["title"] == "Account Management"
+
     def test_unknown_control_returns_none(self):
         """Test that unknown control returns None."""
         prompt = get_control_prompt("unknown-control-xyz")
@@ -251,3 +261,17 @@ class TestFrameworkGuideContent:
             guide = FRAMEWORK_GUIDES[framework_id]
             # Should have analysis-related content
             assert "analysis" in guide.lower() or "control" in guide.lower()
+
+
+class TestBundledPromptFiles:
+    """Tests for the on-disk prompt and guide files."""
+
+    def test_index_matches_bundled_files(self):
+        """Every indexed ID has a file and every file is indexed."""
+        from pretorin.mcp.prompts import control_prompts, framework_guides
+
+        guide_files = {p.stem for p in framework_guides._GUIDES_DIR.glob("*.md")}
+        control_files = {p.stem for p in control_prompts._CONTROLS_DIR.glob("*.json")}
+
+        assert guide_files == set(framework_guides.FRAMEWORK_GUIDE_IDS)
+        assert control_files == set(control_prompts.CONTROL_PROMPT_IDS)
@@ -5,9 +5,10 @@ Uses httpx.MockTransport to simulate HTTP responses without hitting real servers
 
 from __future__ import annotations
 
+import asyncio
 import json
 from typing import Any
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import httpx
 import pytest
@@ -347,6 +348,22 @@ class TestConfiguration:
         headers = client._get_headers()
         assert "Authorization" not in headers
 
+    async def test_accept_encoding_left_to_httpx_negotiation(self):
+        client = PretorianClient(api_key="my-token", api_base_url=TEST_BASE_URL)
+        assert "Accept-Encoding" not in client._get_headers()
+        http_client = await client._get_client()
+        try:
+            assert "gzip" in http_client.headers["Accept-Encoding"]
+        finally:
+            await client.close()
+
+    def test_headers_are_computed_once_and_read_only(self):
+        client = PretorianClient(api_key="my-token", api_base_url=TEST_BASE_URL)
+        headers = client._get_headers()
+        assert client._get_headers() is headers
+        with pytest.raises(TypeError):
+            headers["Authorization"] = "Bearer other"  # type: ignore[index]
+
     def test_base_url_trailing_slash_stripped(self):
         client = PretorianClient(api_key="k", api_base_url="https://example.com/api/")
         assert client._api_base_url == "https://example.com/api"
@@ -488,6 +505,17 @@ class TestErrorHandling:
             await client._request("GET", "/frameworks")
         assert "Bad Gateway" in str(exc_info.value)
 
+    async def test_error_with_html_body_is_not_decoded(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(400, content=b"<html>Bad Request</html>")
+
+        client = _make_client(handler)
+        with patch.object(httpx.Response, "json", side_effect=AssertionError("should not decode")):
+            with pytest.raises(PretorianClientError) as exc_info:
+                await client._request("GET", "/frameworks")
+        assert "<html>Bad Request</html>" in str(exc_info.value)
+        assert exc_info.value.details == {}
+
     async def test_error_with_non_dict_json(self):
         def handler(request: httpx.Request) -> httpx.Response:
             return httpx.Response(400, json=["error1", "error2"])
@@ -565,6 +593,31 @@ class TestValidateApiKey:
         with pytest.raises(AuthenticationError):
             await client.validate_api_key()
 
+    async def test_validate_api_key_does_not_decode_body(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=b"not json")
+
+        client = _make_client(handler)
+        assert await client.validate_api_key() is True
+
+    async def test_validate_api_key_bypasses_response_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("pretorin.client.api.RESPONSE_CACHE_DIR", tmp_path)
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(
+                200,
+                json={"frameworks": [], "total": 0},
+                headers={"ETag": '"v1"', "Cache-Control": "max-age=3600"},
+            )
+
+        client = _make_client(handler)
+        await client.list_frameworks()
+        await client.validate_api_key()
+        assert calls == 2
+
 
 class TestFrameworkEndpoints:
     """Test framework-related API methods."""
@@ -703,6 +756,16 @@ class TestControlEndpoints:
         assert result.id == "ac-02"
         assert result.control_type == "system"
 
+    async def test_get_controls_bulk_preserves_order(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            control_id = request.url.path.rsplit("/", 1)[-1]
+            return httpx.Response(200, json={**CONTROL_DETAIL, "id": control_id})
+
+        client = _make_client(handler)
+        result = await client.get_controls_bulk("nist-800-53-r5", ["sc-07", "ac-2", "au-02"], concurrency=2)
+        assert [control.id for control in result] == ["sc-07", "ac-02", "au-02"]
+        assert all(isinstance(control, ControlDetail) for control in result)
+
     async def test_get_controls_batch(self):
         captured_body: dict[str, Any] = {}
 
@@ -781,6 +844,22 @@ class TestControlEndpoints:
         assert captured_path.endswith("/frameworks/controls/metadata")
         assert len(result) == 2
 
+    async def test_get_controls_metadata_large_payload_decoded_off_loop(self):
+        payload = {
+            f"ac-{i:04d}": {"title": f"Control {i} " + "x" * 100, "family": "ac", "type": "system"} for i in range(1000)
+        }
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=payload)
+
+        client = _make_client(handler)
+        with patch("pretorin.client.api.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            result = await client.get_controls_metadata()
+
+        assert to_thread.call_count == 2  # JSON decode + model validation
+        assert len(result) == 1000
+        assert isinstance(result["ac-0999"], ControlMetadata)
+
 
 class TestDocumentRequirementsEndpoint:
     """Test document requirements retrieval."""
@@ -1427,3 +1506,311 @@ class TestGetClientLazyInit:
         c2 = await client._get_client()
         assert c1 is not c2
         await client.close()
+
+
+class TestResponseCache:
+    """Test the on-disk ETag cache for framework reference endpoints."""
+
+    @pytest.fixture(autouse=True)
+    def _cache_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("pretorin.client.api.RESPONSE_CACHE_DIR", tmp_path / "cache")
+
+    async def test_revalidates_with_etag_and_reuses_body_on_304(self):
+        seen_if_none_match: list[str | None] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_if_none_match.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json=FRAMEWORK_METADATA, headers={"ETag": '"v1"'})
+
+        client = _make_client(handler)
+        first = await client.get_framework("nist-800-53-r5")
+        second = await client.get_framework("nist-800-53-r5")
+
+        assert seen_if_none_match == [None, '"v1"']
+        assert first == second
+
+    async def test_fresh_entry_skips_request(self):
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(
+                200,
+                json=[CONTROL_SUMMARY],
+                headers={"ETag": '"v1"', "Cache-Control": "max-age=3600"},
+            )
+
+        client = _make_client(handler)
+        await client.list_controls("nist-800-53-r5")
+        result = await client.list_controls("nist-800-53-r5")
+
+        assert calls == 1
+        assert result[0].id == "ac-02"
+
+    async def test_params_are_part_of_cache_key(self):
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(
+                200,
+                json=[CONTROL_SUMMARY],
+                headers={"ETag": '"v1"', "Cache-Control": "max-age=3600"},
+            )
+
+        client = _make_client(handler)
+        await client.list_controls("nist-800-53-r5", family_id="ac")
+        await client.list_controls("nist-800-53-r5", family_id="au")
+
+        assert calls == 2
+
+    async def test_responses_without_etag_are_not_cached(self, tmp_path):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=FRAMEWORK_METADATA)
+
+        client = _make_client(handler)
+        await client.get_framework("nist-800-53-r5")
+
+        assert not (tmp_path / "cache").exists()
+
+    async def test_non_framework_paths_are_not_cached(self, tmp_path):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"systems": []}, headers={"ETag": '"v1"'})
+
+        client = _make_client(handler)
+        await client.list_systems()
+
+        assert not (tmp_path / "cache").exists()
+
+    async def test_custom_framework_revisions_are_not_cached(self, tmp_path):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=[], headers={"ETag": '"v1"', "Cache-Control": "max-age=3600"})
+
+        client = _make_client(handler)
+        await client.list_revisions("custom-fw")
+
+        assert not (tmp_path / "cache").exists()
+
+    async def test_publish_invalidates_cached_framework_list(self):
+        list_calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal list_calls
+            if request.method == "POST":
+                return httpx.Response(200, json={"revision_id": "rev-1", "lifecycle_state": "published"})
+            list_calls += 1
+            return httpx.Response(
+                200,
+                json={"frameworks": [], "total": list_calls},
+                headers={"ETag": f'"v{list_calls}"', "Cache-Control": "max-age=3600"},
+            )
+
+        client = _make_client(handler)
+        await client.list_frameworks()
+        await client.publish_draft("custom-fw", "rev-1")
+        result = await client.list_frameworks()
+
+        assert list_calls == 2
+        assert result.total == 2
+
+    async def test_batch_control_fetch_keeps_cache(self):
+        list_calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal list_calls
+            if request.method == "POST":
+                return httpx.Response(200, json={"controls": [], "total": 0})
+            list_calls += 1
+            return httpx.Response(
+                200,
+                json={"frameworks": [], "total": 0},
+                headers={"ETag": '"v1"', "Cache-Control": "max-age=3600"},
+            )
+
+        client = _make_client(handler)
+        await client.list_frameworks()
+        await client._request("POST", "/frameworks/nist-800-53-r5/controls/batch", json={"control_ids": []})
+        await client.list_frameworks()
+
+        assert list_calls == 1
+
+    async def test_entries_are_owner_only(self, tmp_path):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=FRAMEWORK_METADATA, headers={"ETag": '"v1"'})
+
+        client = _make_client(handler)
+        await client.get_framework("nist-800-53-r5")
+
+        entries = list((tmp_path / "cache").iterdir())
+        assert sorted(entry.suffix for entry in entries) == [".json", ".meta"]
+        assert all(entry.stat().st_mode & 0o777 == 0o600 for entry in entries)
+
+    async def test_revalidation_rewrites_only_metadata(self, tmp_path):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json=FRAMEWORK_METADATA, headers={"ETag": '"v1"'})
+
+        client = _make_client(handler)
+        await client.get_framework("nist-800-53-r5")
+        (body_file,) = (tmp_path / "cache").glob("*.json")
+        (meta_file,) = (tmp_path / "cache").glob("*.meta")
+        body_inode, meta_inode = body_file.stat().st_ino, meta_file.stat().st_ino
+
+        await client.get_framework("nist-800-53-r5")
+
+        assert body_file.stat().st_ino == body_inode
+        assert meta_file.stat().st_ino != meta_inode
+
+    async def test_missing_body_on_304_refetches(self, tmp_path):
+        seen_if_none_match: list[str | None] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_if_none_match.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                (body_file,) = (tmp_path / "cache").glob("*.json")
+                body_file.unlink()
+                return httpx.Response(304)
+            return httpx.Response(200, json=FRAMEWORK_METADATA, headers={"ETag": '"v1"'})
+
+        client = _make_client(handler)
+        await client.get_framework("nist-800-53-r5")
+        result = await client.get_framework("nist-800-53-r5")
+
+        assert seen_if_none_match == [None, '"v1"', None]
+        assert result.id == FRAMEWORK_METADATA["id"]
+
+    async def test_large_bodies_round_trip(self):
+        from pretorin.client.api import _OFFLOAD_DECODE_BYTES
+
+        calls = 0
+        controls = [{**CONTROL_SUMMARY, "title": "x" * 1024} for _ in range(_OFFLOAD_DECODE_BYTES // 1024 + 1)]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(200, json=controls, headers={"ETag": '"v1"', "Cache-Control": "max-age=3600"})
+
+        client = _make_client(handler)
+        await client.list_controls("nist-800-53-r5")
+        result = await client.list_controls("nist-800-53-r5")
+
+        assert calls == 1
+        assert len(result) == len(controls)
+
+    async def test_oldest_entries_are_evicted(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("pretorin.client.api.RESPONSE_CACHE_MAX_ENTRIES", 2)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=[CONTROL_SUMMARY], headers={"ETag": '"v1"'})
+
+        client = _make_client(handler)
+        for family_id in ("ac", "au", "cm"):
+            await client.list_controls("nist-800-53-r5", family_id=family_id)
+
+        assert len(list((tmp_path / "cache").glob("*.meta"))) == 2
+        assert len(list((tmp_path / "cache").glob("*.json"))) == 2
+
+    async def test_clear_response_cache(self, tmp_path):
+        from pretorin.client.api import clear_response_cache
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=FRAMEWORK_METADATA, headers={"ETag": '"v1"'})
+
+        client = _make_client(handler)
+        await client.get_framework("nist-800-53-r5")
+
+        assert clear_response_cache() == 1
+        assert list((tmp_path / "cache").iterdir()) == []
+        assert clear_response_cache() == 0
+
+
+class TestSharedClient:
+    """Test the process-wide shared client helpers."""
+
+    async def test_shared_client_reused_within_loop(self):
+        from pretorin.client.api import close_shared_client, get_shared_client
+
+        try:
+            assert get_shared_client() is get_shared_client()
+        finally:
+            await close_shared_client()
+
+    async def test_close_shared_client_resets_instance(self):
+        from pretorin.client.api import close_shared_client, get_shared_client
+
+        first = get_shared_client()
+        await first._get_client()
+        await close_shared_client()
+        assert first._client is None
+
+        second = get_shared_client()
+        try:
+            assert second is not first
+        finally:
+            await close_shared_client()
+
+    async def test_close_shared_client_without_instance_is_noop(self):
+        from pretorin.client.api import close_shared_client
+
+        await close_shared_client()
+        await close_shared_client()
+
+    async def test_shared_client_replaced_when_credentials_change(self):
+        from pretorin.client.api import close_shared_client, get_shared_client
+
+        config = MagicMock()
+        config.api_key = "key-1"
+        config.api_base_url = "https://api.example.com/"
+        try:
+            with patch("pretorin.client.api.Config", return_value=config):
+                first = get_shared_client()
+                assert get_shared_client() is first
+                assert first.api_base_url == "https://api.example.com"
+                await first._get_client()
+
+                config.api_key = "key-2"
+                second = get_shared_client()
+            assert second is not first
+            assert second._api_key == "key-2"
+            # The replaced client stays open for calls still using it.
+            assert first._client is not None
+        finally:
+            await close_shared_client()
+        assert first._client is None
+
+    async def test_shared_client_sees_config_file_written_elsewhere(self, tmp_path, monkeypatch):
+        from pretorin.client.api import close_shared_client, get_shared_client
+
+        config_file = tmp_path / "config.json"
+        monkeypatch.setattr("pretorin.client.config.CONFIG_FILE", config_file)
+        monkeypatch.delenv("PRETORIN_API_KEY", raising=False)
+        config_file.write_text(json.dumps({"api_key": "old-key"}))
+        try:
+            assert get_shared_client()._api_key == "old-key"
+
+            # Simulate `pretorin login` from another process.
+            config_file.write_text(json.dumps({"api_key": "new-key-longer"}))
+            assert get_shared_client()._api_key == "new-key-longer"
+        finally:
+            await close_shared_client()
+
+    def test_shared_client_not_reused_across_event_loops(self):
+        import asyncio
+
+        from pretorin.client import api
+
+        async def grab() -> PretorianClient:
+            return api.get_shared_client()
+
+        first = asyncio.run(grab())
+        second = asyncio.run(grab())
+        try:
+            assert first is not second
+        finally:
+            api._shared_client = None
+            api._shared_client_loop = None
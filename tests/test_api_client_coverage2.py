@@ -124,3 +124,21 @@ class TestRequestRetry429:
         with patch("pretorin.client.api.asyncio.sleep"):
             with pytest.raises(RateLimitError):
                 await client._request("GET", "/test")
+
+    @pytest.mark.asyncio
+    async def test_request_retry_resends_same_body(self):
+        """Retries re-send the prebuilt request, including its JSON body."""
+        bodies: list[bytes] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append(request.read())
+            if len(bodies) == 1:
+                return httpx.Response(503, json={"detail": "unavailable"})
+            return httpx.Response(200, json={"ok": True})
+
+        client = _make_client(handler)
+        with patch("pretorin.client.api.asyncio.sleep"):
+            result = await client._request("POST", "/test", json={"name": "x"})
+
+        assert result == {"ok": True}
+        assert bodies == [b'{"name":"x"}', b'{"name":"x"}']
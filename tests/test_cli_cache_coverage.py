@@ -0,0 +1,45 @@
+"""Coverage tests for src/pretorin/cli/cache.py.
+
+Covers: cache clear, cache path commands.
+"""
+
+from __future__ import annotations
+
+from typer.testing import CliRunner
+
+from pretorin.cli.main import app
+
+runner = CliRunner()
+
+
+class TestCacheCommands:
+    """Tests for `pretorin cache clear` and `pretorin cache path`."""
+
+    def test_clear_removes_entries(self, tmp_path, monkeypatch) -> None:
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        (cache_dir / "abc.json").write_text("{}")
+        (cache_dir / "abc.meta").write_text("{}")
+        monkeypatch.setattr("pretorin.client.api.RESPONSE_CACHE_DIR", cache_dir)
+
+        result = runner.invoke(app, ["cache", "clear"])
+
+        assert result.exit_code == 0
+        assert "Removed 1 cached response(s)" in result.output
+        assert list(cache_dir.iterdir()) == []
+
+    def test_clear_without_cache_dir(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.setattr("pretorin.client.api.RESPONSE_CACHE_DIR", tmp_path / "missing")
+
+        result = runner.invoke(app, ["cache", "clear"])
+
+        assert result.exit_code == 0
+        assert "Removed 0 cached response(s)" in result.output
+
+    def test_path_prints_cache_dir(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.setattr("pretorin.client.api.RESPONSE_CACHE_DIR", tmp_path / "cache")
+
+        result = runner.invoke(app, ["cache", "path"])
+
+        assert result.exit_code == 0
+        assert "cache" in result.output
@@ -8,6 +8,8 @@ version command, update command, mcp_serve command.
 from __future__ import annotations
 
 import json
+import subprocess
+import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -220,3 +222,8 @@ class TestMcpServeCommand:
 
         assert result.exit_code == 0
         mock_run.assert_called_once()
+
+
+def test_importing_cli_main_does_not_load_mcp_sdk():
+    code = "import sys, pretorin.cli.main; sys.exit(int('mcp' in sys.modules))"
+    assert subprocess.run([sys.executable, "-c", code], check=False).returncode == 0
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -187,3 +189,240 @@ def test_clearing_active_system_also_clears_context_url(
     cfg.active_system_id = None
     cfg_reloaded = config_module.Config()
     assert cfg_reloaded.context_api_base_url is None
+
+
+def test_config_construction_does_no_io(
+    monkeypatch: MonkeyPatch,
+    isolated_config_paths: Path,
+) -> None:
+    def fail_stat(*args: object, **kwargs: object) -> None:
+        raise AssertionError("Config() should not touch the filesystem")
+
+    monkeypatch.setattr(config_module.os, "stat", fail_stat)
+    config_module.Config()
+
+
+def test_unchanged_config_file_is_not_reparsed(
+    monkeypatch: MonkeyPatch,
+    isolated_config_paths: Path,
+) -> None:
+    config_module.Config().set("active_system_id", "sys-1")
+
+    def fail_load(*args: object, **kwargs: object) -> None:
+        raise AssertionError("unchanged config should come from the cache")
+
+    monkeypatch.setattr(config_module.json, "loads", fail_load)
+    assert config_module.Config().get("active_system_id") == "sys-1"
+
+
+def test_external_config_edit_is_picked_up(isolated_config_paths: Path) -> None:
+    config_module.Config().set("active_system_id", "sys-1")
+    isolated_config_paths.write_text('{"active_system_id": "sys-22"}')
+
+    assert config_module.Config().get("active_system_id") == "sys-22"
+
+
+def test_external_config_edit_is_picked_up_by_get_config(
+    monkeypatch: MonkeyPatch,
+    isolated_config_paths: Path,
+) -> None:
+    monkeypatch.delenv(config_module.ENV_API_KEY, raising=False)
+    config_module.get_config().set("api_key", "old-key")
+    isolated_config_paths.write_text('{"api_key": "new-key-from-login"}')
+
+    assert config_module.get_config().api_key == "new-key-from-login"
+
+
+def test_get_config_picks_up_environment_changes(
+    monkeypatch: MonkeyPatch,
+    isolated_config_paths: Path,
+) -> None:
+    monkeypatch.setenv(config_module.ENV_SYSTEM_ID, "sys-env-1")
+    assert config_module.get_config().active_system_id == "sys-env-1"
+
+    monkeypatch.setenv(config_module.ENV_SYSTEM_ID, "sys-env-2")
+    assert config_module.get_config().active_system_id == "sys-env-2"
+
+
+def test_save_writes_owner_only_file_atomically(
+    monkeypatch: MonkeyPatch,
+    isolated_config_paths: Path,
+) -> None:
+    monkeypatch.delenv(config_module.ENV_API_KEY, raising=False)
+    config_module.Config().set("api_key", "secret")
+
+    assert isolated_config_paths.stat().st_mode & 0o777 == 0o600
+    assert [p.name for p in isolated_config_paths.parent.iterdir()] == ["config.json"]
+    assert config_module.Config().get("api_key") == "secret"
+
+
+def test_env_vars_are_read_once_per_instance(
+    monkeypatch: MonkeyPatch,
+    isolated_config_paths: Path,
+) -> None:
+    monkeypatch.setenv(config_module.ENV_SYSTEM_ID, "sys-env-1")
+    cfg = config_module.Config()
+    assert cfg.active_system_id == "sys-env-1"
+
+    monkeypatch.setenv(config_module.ENV_SYSTEM_ID, "sys-env-2")
+    assert cfg.active_system_id == "sys-env-1"
+    assert config_module.Config().active_system_id == "sys-env-2"
+
+
+def test_get_config_returns_shared_instance(isolated_config_paths: Path) -> None:
+    assert config_module.get_config() is config_module.get_config()
+
+
+def test_get_config_rebuilt_when_config_path_changes(monkeypatch: MonkeyPatch, isolated_config_paths: Path) -> None:
+    first = config_module.get_config()
+    monkeypatch.setattr(config_module, "CONFIG_FILE", isolated_config_paths.with_name("other.json"))
+    assert config_module.get_config() is not first
+
+
+def test_get_config_sees_writes_from_other_instances(
+    monkeypatch: MonkeyPatch,
+    isolated_config_paths: Path,
+) -> None:
+    monkeypatch.delenv(config_module.ENV_FRAMEWORK_ID, raising=False)
+    shared = config_module.get_config()
+    assert shared.active_framework_id is None
+
+    config_module.Config().active_framework_id = "fedramp-moderate"
+    assert shared.active_framework_id == "fedramp-moderate"
+
+    config_module.Config().clear()
+    assert shared.active_framework_id is None
+
+
+def test_batch_defers_save_until_outermost_exit(
+    monkeypatch: MonkeyPatch,
+    isolated_config_paths: Path,
+) -> None:
+    cfg = config_module.Config()
+    saves: list[dict[str, object]] = []
+    original_save = config_module.Config._save
+
+    def counting_save(self: config_module.Config) -> None:
+        saves.append(dict(self._config))
+        original_save(self)
+
+    monkeypatch.setattr(config_module.Config, "_save", counting_save)
+
+    with cfg.batch():
+        cfg.set("active_system_id", "sys-1")
+        with cfg.batch():
+            cfg.set("active_framework_id", "fw-1")
+        cfg.delete("missing-key")
+        assert saves == []
+
+    assert saves == [{"active_system_id": "sys-1", "active_framework_id": "fw-1"}]
+    assert config_module.Config().to_dict() == saves[0]
+
+
+def test_batch_without_changes_does_not_save(
+    monkeypatch: MonkeyPatch,
+    isolated_config_paths: Path,
+) -> None:
+    cfg = config_module.Config()
+    monkeypatch.setattr(config_module.Config, "_save", lambda self: pytest.fail("unexpected save"))
+
+    with cfg.batch():
+        cfg.delete("missing-key")
+
+
+def test_legacy_platform_url_env_used_when_primary_empty(
+    monkeypatch: MonkeyPatch,
+    isolated_config_paths: Path,
+) -> None:
+    monkeypatch.setenv(config_module.ENV_PLATFORM_API_BASE_URL, "")
+    monkeypatch.setenv(config_module.ENV_API_BASE_URL, "https://legacy.example/v1")
+
+    assert config_module.Config().platform_api_base_url == "https://legacy.example/v1"
+
+
+def test_failed_save_keeps_previous_file_and_removes_temp(
+    monkeypatch: MonkeyPatch,
+    isolated_config_paths: Path,
+) -> None:
+    config_module.Config().set("active_system_id", "sys-1")
+
+    def fail_replace(src: str, dst: object) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(config_module.os, "replace", fail_replace)
+    with pytest.raises(OSError, match="disk full"):
+        config_module.Config().set("active_system_id", "sys-2")
+
+    assert [p.name for p in isolated_config_paths.parent.iterdir()] == ["config.json"]
+    assert '"sys-1"' in isolated_config_paths.read_text()
+
+
+def test_resolved_urls_are_memoized_and_invalidated_on_write(
+    monkeypatch: MonkeyPatch,
+    isolated_config_paths: Path,
+) -> None:
+    monkeypatch.delenv(config_module.ENV_PLATFORM_API_BASE_URL, raising=False)
+    monkeypatch.delenv(config_module.ENV_API_BASE_URL, raising=False)
+    cfg = config_module.Config()
+    assert cfg.platform_api_base_url == config_module.DEFAULT_PLATFORM_API_BASE_URL
+
+    calls: list[str] = []
+    original_get = config_module.Config.get
+
+    def counting_get(self: config_module.Config, key: str, default: object = None) -> object:
+        calls.append(key)
+        return original_get(self, key, default)
+
+    monkeypatch.setattr(config_module.Config, "get", counting_get)
+    assert cfg.platform_api_base_url == config_module.DEFAULT_PLATFORM_API_BASE_URL
+    assert calls == []
+
+    cfg.platform_api_base_url = "https://platform.example/v1"
+    assert cfg.platform_api_base_url == "https://platform.example/v1"
+
+
+def test_save_creates_config_dir_once_and_recovers_if_removed(
+    monkeypatch: MonkeyPatch,
+    isolated_config_paths: Path,
+) -> None:
+    import shutil
+
+    mkdir_calls: list[Path] = []
+    original_mkdir = Path.mkdir
+
+    def counting_mkdir(self: Path, *args: object, **kwargs: object) -> None:
+        mkdir_calls.append(self)
+        original_mkdir(self, *args, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(Path, "mkdir", counting_mkdir)
+    cfg = config_module.Config()
+    cfg.set("a", 1)
+    cfg.set("b", 2)
+    assert mkdir_calls == [isolated_config_paths.parent]
+
+    shutil.rmtree(isolated_config_paths.parent)
+    cfg.set("c", 3)
+    assert config_module.Config().get("c") == 3
+
+
+def test_delete_reports_whether_key_existed(isolated_config_paths: Path) -> None:
+    cfg = config_module.Config()
+    cfg.set("nullable", None)
+
+    assert cfg.delete("nullable") is True
+    assert cfg.delete("nullable") is False
+    assert "nullable" not in config_module.Config().to_dict()
+
+
+def test_config_file_is_written_compact(isolated_config_paths: Path) -> None:
+    config_module.Config().set("active_system_id", "sys-1")
+
+    assert isolated_config_paths.read_text() == '{"active_system_id":"sys-1"}'
+
+
+def test_importing_config_does_not_load_api_client() -> None:
+    code = (
+        "import sys, pretorin.client.config; "
+        "sys.exit(int('pretorin.client.api' in sys.modules or 'pydantic' in sys.modules))"
+    )
+    assert subprocess.run([sys.executable, "-c", code], check=False).returncode == 0
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from typing import Any, cast
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -89,9 +90,11 @@ async def test_client_submit_artifact_normalizes_root_and_nested_control_ids() -
     client._request.assert_awaited_once()
     await_args = client._request.await_args
     assert await_args is not None
-    payload = cast(dict[str, Any], await_args.kwargs["json"])
+    payload = cast(dict[str, Any], json.loads(await_args.kwargs["content"]))
     assert payload["control_id"] == "ac-02"
     assert payload["component"]["control_implementations"][0]["control_id"] == "ac-02"
+    # The caller's model is left untouched.
+    assert artifact.control_id == "ac-2"
 
 
 @pytest.mark.asyncio
@@ -244,6 +247,16 @@ def test_normalize_passes_cmmc_and_800_171_ids_unchanged(raw: str, expected: str
     assert normalize_control_id(raw) == expected
 
 
+def test_normalize_reuses_result_for_repeated_ids() -> None:
+    normalize_control_id.cache_clear()
+
+    assert normalize_control_id("AC-2(1)") == "ac-02(1)"
+    assert normalize_control_id("AC-2(1)") == "ac-02(1)"
+
+    info = normalize_control_id.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
 # =========================================================================
 # get_control_implementation uses exact scoped control lookup
 # =========================================================================
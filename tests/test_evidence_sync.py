@@ -45,6 +45,8 @@ async def test_push_does_not_emit_notifications(monkeypatch: pytest.MonkeyPatch,
 
     assert result.created
     assert result.events == []
+    [local] = EvidenceWriter(base_dir=tmp_path).list_local()
+    assert local.platform_id == "ev-new"
     client.update_control_status.assert_not_called()
     client.create_monitoring_event.assert_not_called()
 
@@ -76,3 +78,91 @@ async def test_push_reuses_existing_matching_evidence(monkeypatch: pytest.Monkey
 
     assert result.reused
     client.create_evidence.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_push_overlaps_distinct_controls_and_keeps_file_order(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    import asyncio
+
+    monkeypatch.setattr("pretorin.client.config.Config", _DummyConfig)
+    writer = EvidenceWriter(base_dir=tmp_path)
+    for control_id, name in [("ac-02", "First"), ("ac-02", "Second"), ("ac-03", "Third")]:
+        writer.write(
+            LocalEvidence(
+                control_id=control_id,
+                framework_id="fedramp-moderate",
+                name=name,
+                description="- detail",
+                evidence_type="configuration",
+            )
+        )
+
+    in_flight: dict[str, int] = {}
+    peak = 0
+
+    async def list_evidence(**kwargs):
+        nonlocal peak
+        control_id = kwargs["control_id"]
+        in_flight[control_id] = in_flight.get(control_id, 0) + 1
+        assert in_flight[control_id] == 1, "same-control upserts must not overlap"
+        peak = max(peak, sum(in_flight.values()))
+        await asyncio.sleep(0.01)
+        in_flight[control_id] -= 1
+        return []
+
+    client = AsyncMock()
+    client.list_evidence = AsyncMock(side_effect=list_evidence)
+    client.create_evidence = AsyncMock(return_value={"id": "ev-new"})
+    client.link_evidence_to_control = AsyncMock(return_value={"linked": True})
+
+    result = await EvidenceSync(evidence_dir=tmp_path).push(client)
+
+    assert peak == 2
+    assert result.created == [
+        "fedramp-moderate/ac-02/First",
+        "fedramp-moderate/ac-02/Second",
+        "fedramp-moderate/ac-03/Third",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_push_serializes_control_id_spellings(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    import asyncio
+
+    monkeypatch.setattr("pretorin.client.config.Config", _DummyConfig)
+    writer = EvidenceWriter(base_dir=tmp_path)
+    for control_id in ["AC-2", "ac-2", "ac-02"]:
+        writer.write(
+            LocalEvidence(
+                control_id=control_id,
+                framework_id="fedramp-moderate",
+                name=f"Evidence {control_id}",
+                description="- detail",
+                evidence_type="configuration",
+            )
+        )
+
+    in_flight = 0
+    seen_control_ids: list[str] = []
+
+    async def list_evidence(**kwargs):
+        nonlocal in_flight
+        seen_control_ids.append(kwargs["control_id"])
+        in_flight += 1
+        assert in_flight == 1, "upserts for the same normalized control must not overlap"
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return []
+
+    client = AsyncMock()
+    client.list_evidence = AsyncMock(side_effect=list_evidence)
+    client.create_evidence = AsyncMock(return_value={"id": "ev-new"})
+    client.link_evidence_to_control = AsyncMock(return_value={"linked": True})
+
+    result = await EvidenceSync(evidence_dir=tmp_path).push(client)
+
+    assert seen_control_ids == ["ac-02", "ac-02", "ac-02"]
+    assert len(result.created) == 3
+    assert result.errors == []
@@ -185,3 +185,41 @@ class TestUploadClientValidation:
                 file_path=str(f),
                 name="test",
             )
+
+    @pytest.mark.anyio
+    async def test_rejects_directory(self, tmp_path: Path) -> None:
+        from pretorin.client.api import PretorianClient, PretorianClientError
+
+        client = PretorianClient.__new__(PretorianClient)
+        with pytest.raises(PretorianClientError, match="File not found"):
+            await client.upload_evidence(
+                system_id="sys-1",
+                file_path=str(tmp_path),
+                name="test",
+            )
+
+    @pytest.mark.anyio
+    async def test_streams_file_with_checksum(self, tmp_path: Path) -> None:
+        import hashlib
+
+        import httpx
+
+        from pretorin.client.api import PretorianClient
+
+        f = tmp_path / "policy.pdf"
+        f.write_bytes(b"policy contents")
+        captured: dict[str, object] = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            captured["checksum"] = request.url.params.get("checksum")
+            captured["body"] = request.read()
+            return httpx.Response(200, json={"evidence_id": "ev-1"})
+
+        client = PretorianClient(api_key="key", api_base_url="https://test.example")
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url="https://test.example")
+        with patch("pretorin.client.api._build_source_verification", return_value=None):
+            result = await client.upload_evidence(system_id="sys-1", file_path=str(f), name="Policy")
+
+        assert result == {"evidence_id": "ev-1"}
+        assert captured["checksum"] == hashlib.sha256(b"policy contents").hexdigest()
+        assert b"policy contents" in captured["body"]  # type: ignore[operator]
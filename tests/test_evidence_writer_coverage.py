@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -211,3 +212,96 @@ class TestEvidenceWriterListLocal:
         results = writer.list_local(framework_id="fedramp-moderate")
         assert len(results) == 1
         assert results[0].framework_id == "fedramp-moderate"
+
+    def test_list_local_skip_synced_bodies(self, tmp_path):
+        """Synced files keep their labels but skip the description body."""
+        writer = EvidenceWriter(base_dir=tmp_path)
+        for name, platform_id in [("Synced", "plat-1"), ("Pending", None)]:
+            writer.write(
+                LocalEvidence(
+                    control_id="ac-02",
+                    framework_id="fedramp-moderate",
+                    name=name,
+                    description=f"{name} body",
+                    evidence_type="policy_document",
+                    platform_id=platform_id,
+                )
+            )
+
+        results = {ev.name: ev for ev in writer.list_local(skip_synced_bodies=True)}
+
+        assert results["Synced"].platform_id == "plat-1"
+        assert results["Synced"].description == ""
+        assert results["Pending"].description == "Pending body"
+
+    def test_list_local_opens_each_file_once(self, tmp_path):
+        writer = EvidenceWriter(base_dir=tmp_path)
+        for name, platform_id in [("Synced", "plat-1"), ("Pending", None)]:
+            writer.write(
+                LocalEvidence(
+                    control_id="ac-02",
+                    framework_id="fedramp-moderate",
+                    name=name,
+                    description=f"{name} body",
+                    evidence_type="policy_document",
+                    platform_id=platform_id,
+                )
+            )
+
+        with patch.object(Path, "open", autospec=True, side_effect=Path.open) as opened:
+            writer.list_local(skip_synced_bodies=True)
+
+        assert sorted(call.args[0].stem for call in opened.call_args_list) == ["pending", "synced"]
+
+
+class TestEvidenceWriterReadWithoutDescription:
+    """Tests for read(skip_synced_description=True)."""
+
+    def test_header_read_matches_full_read(self, tmp_path):
+        path = tmp_path / "evidence.md"
+        path.write_text(
+            "---\ncontrol_id: ac-02\nframework_id: fedramp-moderate\nevidence_type: configuration\n"
+            "platform_id: ev-1\n---\n\n"
+            "# Title\n\n" + "line\n" * 1000
+        )
+        writer = EvidenceWriter(base_dir=tmp_path)
+
+        full = writer.read(path)
+        header = writer.read(path, skip_synced_description=True)
+
+        assert header.name == full.name == "Title"
+        assert header.description == ""
+        assert (header.control_id, header.framework_id, header.evidence_type) == (
+            full.control_id,
+            full.framework_id,
+            full.evidence_type,
+        )
+
+    def test_heading_inside_unclosed_frontmatter_is_not_the_title(self, tmp_path):
+        path = tmp_path / "evidence.md"
+        path.write_text("---\n# not a title\nevidence_type: other\nplatform_id: ev-1\n---\n\n# Real\n\nbody\n")
+
+        assert EvidenceWriter(base_dir=tmp_path).read(path, skip_synced_description=True).name == "Real"
+
+
+class TestEvidenceWriterDirectoryReuse:
+    """Tests for write() directory handling."""
+
+    def test_write_recreates_directory_removed_after_first_write(self, tmp_path):
+        import shutil
+
+        writer = EvidenceWriter(base_dir=tmp_path)
+        ev = LocalEvidence(
+            control_id="ac-02",
+            framework_id="fedramp-moderate",
+            name="First",
+            description="d",
+            evidence_type="policy_document",
+        )
+        writer.write(ev)
+        shutil.rmtree(tmp_path / "fedramp-moderate")
+
+        ev.name = "Second"
+        path = writer.write(ev)
+
+        assert path.read_text().startswith("---\n")
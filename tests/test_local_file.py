@@ -0,0 +1,131 @@
+"""Tests for shared local markdown/frontmatter helpers."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from pretorin.local_file import (
+    list_markdown_files,
+    parse_frontmatter,
+    read_frontmatter_and_body,
+    update_file_frontmatter,
+    write_text_atomic,
+)
+
+
+def test_update_file_frontmatter_missing_file_is_noop(tmp_path: Path) -> None:
+    path = tmp_path / "missing.md"
+    update_file_frontmatter(path, "---\nid: 1\n---")
+    assert not path.exists()
+
+
+def test_update_file_frontmatter_preserves_body(tmp_path: Path) -> None:
+    path = tmp_path / "note.md"
+    path.write_text("---\nid: old\n---\n\nBody text\n")
+
+    update_file_frontmatter(path, "---\nid: new\n---")
+
+    fm, body = parse_frontmatter(path.read_text())
+    assert fm == {"id": "new"}
+    assert body == "Body text"
+
+
+def test_read_frontmatter_and_body_frontmatter_only(tmp_path: Path) -> None:
+    path = tmp_path / "evidence.md"
+    path.write_text("---\ncontrol_id: ac-02\nplatform_id: ev-1\n---\n\n# Name\n\n" + "body\n" * 1000)
+
+    fm, body = read_frontmatter_and_body(path, skip_body=lambda fm: True)
+    assert fm == parse_frontmatter(path.read_text())[0]
+    assert fm == {"control_id": "ac-02", "platform_id": "ev-1"}
+    assert body == ""
+
+
+def test_read_frontmatter_and_body_without_fences_is_empty(tmp_path: Path) -> None:
+    plain = tmp_path / "plain.md"
+    plain.write_text("# Just a heading\n")
+    unclosed = tmp_path / "unclosed.md"
+    unclosed.write_text("---\ncontrol_id: ac-02\n")
+
+    assert read_frontmatter_and_body(plain, skip_body=lambda fm: True)[0] == {}
+    assert read_frontmatter_and_body(unclosed, skip_body=lambda fm: True)[0] == {}
+
+
+def test_list_markdown_files_matches_sorted_rglob(tmp_path: Path) -> None:
+    for rel in ["b/x.md", "a-b/x.md", "a/x.md", "a/nested/y.md", "a/skip.txt", "z.md"]:
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("---\n---\n")
+
+    assert list_markdown_files(tmp_path) == sorted(tmp_path.rglob("*.md"))
+
+
+def test_update_file_frontmatter_skips_identical_rewrite(tmp_path: Path) -> None:
+    path = tmp_path / "note.md"
+    path.write_text("---\nid: same\n---\n\nBody text\n")
+    os.utime(path, ns=(0, 0))
+
+    update_file_frontmatter(path, "---\nid: same\n---")
+
+    assert path.stat().st_mtime_ns == 0
+
+
+def test_write_text_atomic_replaces_without_leftovers(tmp_path: Path) -> None:
+    path = tmp_path / "evidence.md"
+    path.write_text("old")
+
+    write_text_atomic(path, "new")
+
+    assert path.read_text() == "new"
+    assert [p.name for p in tmp_path.iterdir()] == ["evidence.md"]
+
+
+def test_read_frontmatter_and_body_matches_parse_frontmatter(tmp_path: Path) -> None:
+    cases = {
+        "full.md": "---\ncontrol_id: ac-02\n---\n\n# Name\n\nBody\n",
+        "plain.md": "# Just a heading\n",
+        "unclosed.md": "---\ncontrol_id: ac-02\nbody\n",
+    }
+    for name, text in cases.items():
+        path = tmp_path / name
+        path.write_text(text)
+        assert read_frontmatter_and_body(path) == parse_frontmatter(text)
+
+
+def test_read_frontmatter_and_body_skips_body(tmp_path: Path) -> None:
+    path = tmp_path / "evidence.md"
+    path.write_text("---\nplatform_id: ev-1\n---\n\n# Name\n\nDescription\n")
+
+    def synced(fm: dict[str, str]) -> bool:
+        return bool(fm.get("platform_id"))
+
+    assert read_frontmatter_and_body(path, skip_body=synced) == ({"platform_id": "ev-1"}, "")
+    assert read_frontmatter_and_body(path, skip_body=synced, head_until=lambda line: line.startswith("# ")) == (
+        {"platform_id": "ev-1"},
+        "# Name",
+    )
+    assert read_frontmatter_and_body(path, skip_body=lambda fm: False)[1] == "# Name\n\nDescription"
+
+
+def test_write_text_atomic_keeps_mode(tmp_path: Path) -> None:
+    path = tmp_path / "evidence.md"
+    path.write_text("old")
+    path.chmod(0o640)
+
+    write_text_atomic(path, "new")
+
+    assert path.read_text() == "new"
+    assert path.stat().st_mode & 0o777 == 0o640
+
+
+def test_write_text_atomic_follows_symlink(tmp_path: Path) -> None:
+    target = tmp_path / "shared" / "evidence.md"
+    target.parent.mkdir()
+    target.write_text("old")
+    link = tmp_path / "evidence.md"
+    link.symlink_to(target)
+
+    write_text_atomic(link, "new")
+
+    assert link.is_symlink()
+    assert target.read_text() == "new"
@@ -22,6 +22,14 @@ class TestListResources:
         resources = await list_resources()
         assert isinstance(resources, list)
 
+    @pytest.mark.asyncio
+    async def test_list_resources_reuses_built_catalog(self):
+        """Test that resources are built once and returned as fresh lists."""
+        first = await list_resources()
+        second = await list_resources()
+        assert first is not second
+        assert first[0] is second[0]
+
     @pytest.mark.asyncio
     async def test_list_resources_contains_schema(self):
         """Test that schema resource is listed."""
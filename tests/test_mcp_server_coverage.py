@@ -25,11 +25,9 @@ class TestCallToolErrorHandlers:
 
         mock_client = AsyncMock()
         mock_client.is_configured = True
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
 
         with (
-            patch("pretorin.mcp.server.PretorianClient", return_value=mock_client),
+            patch("pretorin.mcp.server.get_shared_client", return_value=mock_client),
             patch(
                 "pretorin.mcp.server.TOOL_HANDLERS",
                 {"test_tool": AsyncMock(side_effect=AuthenticationError("Token expired", status_code=401))},
@@ -47,11 +45,9 @@ class TestCallToolErrorHandlers:
 
         mock_client = AsyncMock()
         mock_client.is_configured = True
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
 
         with (
-            patch("pretorin.mcp.server.PretorianClient", return_value=mock_client),
+            patch("pretorin.mcp.server.get_shared_client", return_value=mock_client),
             patch(
                 "pretorin.mcp.server.TOOL_HANDLERS",
                 {"test_tool": AsyncMock(side_effect=NotFoundError("Resource not found", status_code=404))},
@@ -69,11 +65,9 @@ class TestCallToolErrorHandlers:
 
         mock_client = AsyncMock()
         mock_client.is_configured = True
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
 
         with (
-            patch("pretorin.mcp.server.PretorianClient", return_value=mock_client),
+            patch("pretorin.mcp.server.get_shared_client", return_value=mock_client),
             patch(
                 "pretorin.mcp.server.TOOL_HANDLERS",
                 {"test_tool": AsyncMock(side_effect=PretorianClientError("Server error", status_code=500))},
@@ -91,11 +85,9 @@ class TestCallToolErrorHandlers:
 
         mock_client = AsyncMock()
         mock_client.is_configured = True
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
 
         with (
-            patch("pretorin.mcp.server.PretorianClient", return_value=mock_client),
+            patch("pretorin.mcp.server.get_shared_client", return_value=mock_client),
             patch(
                 "pretorin.mcp.server.TOOL_HANDLERS",
                 {"test_tool": AsyncMock(side_effect=RuntimeError("Unexpected failure"))},
@@ -107,6 +99,42 @@ class TestCallToolErrorHandlers:
         assert "Unexpected failure" in result.content[0].text
 
 
+class TestCallToolCredentials:
+    """Tests for credential pickup across call_tool invocations."""
+
+    @pytest.mark.asyncio
+    async def test_login_between_calls_is_used_by_next_call(self, tmp_path, monkeypatch):
+        """A config written between two calls (e.g. `pretorin login`) applies to the second."""
+        import json
+
+        from pretorin.client.api import close_shared_client
+        from pretorin.mcp.server import call_tool
+
+        config_file = tmp_path / "config.json"
+        monkeypatch.setattr("pretorin.client.config.CONFIG_FILE", config_file)
+        monkeypatch.delenv("PRETORIN_API_KEY", raising=False)
+
+        seen_keys: list[str | None] = []
+
+        async def handler(client, arguments):
+            seen_keys.append(client._api_key)
+            return []
+
+        try:
+            with patch("pretorin.mcp.server.TOOL_HANDLERS", {"test_tool": handler}):
+                first = await call_tool("test_tool", {})
+                config_file.write_text(json.dumps({"api_key": "key-after-login"}))
+                await call_tool("test_tool", {})
+                config_file.write_text(json.dumps({"api_key": "key-after-relogin"}))
+                await call_tool("test_tool", {})
+        finally:
+            await close_shared_client()
+
+        assert first.isError is True
+        assert "Not authenticated" in first.content[0].text
+        assert seen_keys == ["key-after-login", "key-after-relogin"]
+
+
 class TestRunServer:
     """Tests for _run_server and run_server."""
 
@@ -131,9 +159,11 @@ class TestRunServer:
             mock_server.run = AsyncMock()
             mock_server.create_initialization_options = MagicMock(return_value={})
 
-            await _run_server()
+            with patch("pretorin.mcp.server.close_shared_client", new_callable=AsyncMock) as mock_close:
+                await _run_server()
 
             mock_server.run.assert_awaited_once_with(mock_read, mock_write, {})
+            mock_close.assert_awaited_once()
 
     def test_run_server_sync(self):
         """Lines 100-101: run_server calls asyncio.run(_run_server)."""
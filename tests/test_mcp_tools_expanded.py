@@ -107,6 +107,19 @@ class TestToolListing:
         for name in expected:
             assert name in tool_names, f"Missing tool: {name}"
 
+    def test_static_tools_match_dispatch_table(self) -> None:
+        from pretorin.mcp.handlers import TOOL_HANDLERS
+        from pretorin.mcp.tools import _static_tools
+
+        assert {t.name for t in _static_tools()} == set(TOOL_HANDLERS)
+
+    def test_static_tools_are_built_once(self) -> None:
+        first = asyncio.run(list_tools())
+        second = asyncio.run(list_tools())
+
+        assert first is not second
+        assert first[0] is second[0]
+
     def test_all_tools_have_descriptions(self) -> None:
         tools = asyncio.run(list_tools())
         for tool in tools:
@@ -166,12 +179,8 @@ def _blank_active_context() -> None:
 
 
 def _run_tool(name: str, arguments: dict[str, Any], mock_client: AsyncMock) -> Any:
-    """Run a tool call with a mocked client via async context manager patch."""
-    ctx = AsyncMock()
-    ctx.__aenter__ = AsyncMock(return_value=mock_client)
-    ctx.__aexit__ = AsyncMock(return_value=None)
-
-    with patch("pretorin.mcp.server.PretorianClient", return_value=ctx):
+    """Run a tool call with a mocked shared client."""
+    with patch("pretorin.mcp.server.get_shared_client", return_value=mock_client):
         return asyncio.run(call_tool(name, arguments))
 
 
@@ -245,7 +254,7 @@ class TestSystemTools:
         }
 
         with (
-            patch("pretorin.mcp.server.PretorianClient") as mock_client,
+            patch("pretorin.mcp.server.get_shared_client") as mock_client,
             patch("pretorin.mcp.handlers.systems.get_update_status", return_value=status_data),
         ):
             result = asyncio.run(call_tool("pretorin_get_cli_status", {}))
@@ -841,6 +850,12 @@ class TestErrorHandling:
         assert "Error" in text
         assert "Unknown tool" in text
 
+    def test_unknown_tool_skips_client_setup(self) -> None:
+        with patch("pretorin.mcp.server.get_shared_client") as get_client:
+            result = asyncio.run(call_tool("pretorin_nonexistent_tool", {}))
+        get_client.assert_not_called()
+        assert "Unknown tool" in result.content[0].text
+
     def test_not_configured_returns_error(self) -> None:
         client = AsyncMock()
         client.is_configured = False
@@ -276,3 +276,24 @@ class TestArtifactValidationResultModel:
         assert result.valid is False
         assert len(result.errors) == 2
         assert len(result.warnings) == 1
+
+
+class TestModuleExports:
+    """Tests for the models module's public surface."""
+
+    def test_all_lists_every_public_model(self):
+        """Every public BaseModel defined in the module is exported via __all__."""
+        from pydantic import BaseModel
+
+        from pretorin.client import models
+
+        defined = {
+            name
+            for name, obj in vars(models).items()
+            if isinstance(obj, type)
+            and issubclass(obj, BaseModel)
+            and obj.__module__ == models.__name__
+            and not name.startswith("_")
+        }
+        assert defined <= set(models.__all__)
+        assert all(hasattr(models, name) for name in models.__all__)
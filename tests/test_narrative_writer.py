@@ -123,6 +123,25 @@ class TestListLocal:
             results = writer.list_local()
         assert results == []
 
+    def test_list_local_skip_synced_bodies(self, tmp_path):
+        writer = NarrativeWriter(base_dir=tmp_path)
+        for name, synced in [("done", True), ("todo", False)]:
+            writer.write(
+                LocalNarrative(
+                    control_id="ac-02",
+                    framework_id="fedramp-moderate",
+                    name=name,
+                    content=f"{name} body",
+                    platform_synced=synced,
+                )
+            )
+
+        results = {narr.name: narr for narr in writer.list_local(skip_synced_bodies=True)}
+
+        assert results["done"].platform_synced is True
+        assert results["done"].content == ""
+        assert results["todo"].content == "todo body"
+
 
 class TestPathSafety:
     """Path traversal and edge cases."""
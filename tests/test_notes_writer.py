@@ -69,6 +69,25 @@ class TestListLocal:
         with patch.object(writer, "read", side_effect=Exception("bad")):
             assert writer.list_local() == []
 
+    def test_list_local_skip_synced_bodies(self, tmp_path):
+        writer = NotesWriter(base_dir=tmp_path)
+        writer.write(
+            LocalNote(
+                control_id="ac-02",
+                framework_id="fedramp-moderate",
+                name="done",
+                content="old",
+                platform_synced=True,
+            )
+        )
+        writer.write(LocalNote(control_id="ac-02", framework_id="fedramp-moderate", name="todo", content="new"))
+
+        results = {note.name: note for note in writer.list_local(skip_synced_bodies=True)}
+
+        assert results["done"].platform_synced is True
+        assert results["done"].content == ""
+        assert results["todo"].content == "new"
+
 
 class TestParseFrontmatter:
     def test_no_frontmatter(self):
@@ -298,3 +298,41 @@ class TestResolveExecutionScopeControlRequired:
         assert system_id == "sys-1"
         assert framework_id == "fedramp-moderate"
         assert control_id == "ac-02"
+
+
+# ---------------------------------------------------------------------------
+# mcp/helpers.py – validate_enum
+# ---------------------------------------------------------------------------
+
+
+class TestValidateEnum:
+    """validate_enum accepts members and lists the sorted choices otherwise."""
+
+    def test_valid_value_returns_none(self):
+        from pretorin.mcp.helpers import VALID_SEVERITIES, validate_enum
+
+        assert validate_enum("high", VALID_SEVERITIES, "severity") is None
+
+    def test_invalid_value_lists_sorted_choices(self):
+        from pretorin.mcp.helpers import VALID_SEVERITIES, validate_enum
+
+        assert validate_enum("urgent", VALID_SEVERITIES, "severity") == (
+            "Invalid severity: 'urgent'. Must be one of: critical, high, info, low, medium"
+        )
+
+
+# ---------------------------------------------------------------------------
+# mcp/helpers.py – safe_args
+# ---------------------------------------------------------------------------
+
+
+class TestSafeArgs:
+    """safe_args redacts the API key when the log message is formatted."""
+
+    def test_formats_as_redacted_dict(self):
+        from pretorin.mcp.helpers import safe_args
+
+        redacted = safe_args({"api_key": "secret", "system_id": "sys-1"})
+
+        assert str(redacted) == str({"api_key": "***", "system_id": "sys-1"})
+        assert "secret" not in repr(redacted)